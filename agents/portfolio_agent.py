@@ -134,7 +134,7 @@ class PortfolioAgent:
             estimated_cost=play.estimated_cost,
             estimated_duration_months=play.estimated_duration_months,
             priority_level=play.priority_level,
-            tags=play.tags.copy() if play.tags else []
+            tags=list(play.tags)
         )
         
         # Add area tag if not present
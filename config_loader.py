@@ -66,16 +66,18 @@ def validate_config_security(config: Dict[str, Any]) -> bool:
 
         # Check for hardcoded API keys (should not contain actual keys unless explicitly allowed)
         llm_config = config.get('llm', {})
-        api_key = llm_config.get('api_key', '')
+        api_keys = [llm_config.get('api_key', '')]
+        api_keys.extend((provider or {}).get('api_key', '') for provider in llm_config.get('providers') or [])
         
-        # API key should either be empty or be an environment variable reference
-        if api_key and not api_key.startswith('${') and len(api_key) > 10:
-            if allow_file_secrets:
-                # Permit for local/dev when explicitly enabled
-                security_logger.warning("Hardcoded API key detected in configuration, allowed by override")
-                return True
-            security_logger.error("Hardcoded API key detected in configuration")
-            return False
+        # API keys should either be empty or be an environment variable reference
+        for api_key in api_keys:
+            if api_key and not api_key.startswith('${') and len(api_key) > 10:
+                if allow_file_secrets:
+                    # Permit for local/dev when explicitly enabled
+                    security_logger.warning("Hardcoded API key detected in configuration, allowed by override")
+                    return True
+                security_logger.error("Hardcoded API key detected in configuration")
+                return False
         
         return True
         
@@ -234,7 +234,7 @@ class HealthChecker:
             llm = LLMService()
             
             # Check if API key is configured
-            if not llm.config.get('api_key'):
+            if not any(provider.get('api_key') for provider in llm.providers):
                 return HealthCheckResult(
                     name="ai_service",
                     status="degraded",
@@ -250,6 +250,7 @@ class HealthChecker:
                 details={
                     "provider": llm.config.get('provider', 'unknown'),
                     "model": llm.config.get('model', 'unknown'),
+                    "provider_count": len(llm.providers),
                     "circuit_breaker_state": llm.circuit_breaker.state.value,
                     "pii_scrubbing_enabled": self.feature_flags.is_enabled("pii_scrubbing_enabled")
                 },
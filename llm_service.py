@@ -3,12 +3,20 @@ Service for handling LLM interactions.
 """
 import json
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import random
 import re
 import yaml
 import os
-from typing import Dict, Any, Optional
+import threading
+import itertools
+import hashlib
+from collections import OrderedDict
+import numpy as np
+from concurrent.futures import Future
+from functools import lru_cache, wraps
+from typing import Callable, Dict, Any, List, Optional, Pattern, Set, Tuple
 from enum import Enum
 from config_loader import get_llm_config
 from security_manager import security_manager, security_logger, sanitize_streamlit_output
@@ -18,12 +26,22 @@ class CircuitBreakerState(Enum):
     OPEN = "open"          # Circuit is open, rejecting requests
     HALF_OPEN = "half_open"  # Testing if service is back
 
+# Module-level aliases for the hot paths: reading a member off the Enum class
+# goes through the metaclass and costs about ten times a global lookup.
+_CLOSED = CircuitBreakerState.CLOSED
+_OPEN = CircuitBreakerState.OPEN
+_HALF_OPEN = CircuitBreakerState.HALF_OPEN
+
 class CircuitBreaker:
     """
     Circuit breaker pattern implementation for API calls.
     
     Prevents cascade failures by temporarily blocking requests
     when the service is experiencing high failure rates.
+    
+    State transitions are serialized with a lock so concurrent Streamlit
+    sessions cannot under-count failures; the CLOSED check in can_execute
+    stays lock-free since it is a single attribute read.
     """
     
     def __init__(self, failure_threshold: int = 5, timeout: int = 60):
@@ -37,43 +55,84 @@ class CircuitBreaker:
         self.failure_threshold = failure_threshold
         self.timeout = timeout
         self.failure_count = 0
-        self.last_failure_time = 0
-        self.state = CircuitBreakerState.CLOSED
+        self.last_failure_time = 0.0
+        self.state = _CLOSED
+        self._lock = threading.Lock()
     
     def can_execute(self) -> bool:
         """Check if request can be executed."""
-        if self.state == CircuitBreakerState.CLOSED:
+        state = self.state
+        if state is _CLOSED:
             return True
-        elif self.state == CircuitBreakerState.OPEN:
-            if time.time() - self.last_failure_time >= self.timeout:
-                self.state = CircuitBreakerState.HALF_OPEN
-                return True
-            return False
+        elif state is _OPEN:
+            with self._lock:
+                if self.state is not _OPEN:
+                    return True
+                if time.monotonic() - self.last_failure_time >= self.timeout:
+                    self.state = _HALF_OPEN
+                    return True
+                return False
         else:  # HALF_OPEN
             return True
     
+    def is_available(self) -> bool:
+        """Check whether a request would be allowed, without starting a probe."""
+        return self.state is not _OPEN or time.monotonic() - self.last_failure_time >= self.timeout
+    
     def record_success(self):
         """Record a successful operation."""
-        self.failure_count = 0
-        self.state = CircuitBreakerState.CLOSED
+        with self._lock:
+            self.failure_count = 0
+            self.state = _CLOSED
     
     def record_failure(self):
         """Record a failed operation."""
-        self.failure_count += 1
-        self.last_failure_time = time.time()
-        
-        if self.failure_count >= self.failure_threshold:
-            self.state = CircuitBreakerState.OPEN
+        with self._lock:
+            self.failure_count += 1
+            self.last_failure_time = time.monotonic()
+            
+            if self.failure_count >= self.failure_threshold:
+                self.state = _OPEN
+
+class ProvidersUnavailableError(requests.RequestException):
+    """No provider's circuit allows a request; retrying would only wait."""
+
+# Statuses worth retrying; any other 4xx will fail the same way again
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRY_DELAY = 30.0
+
+# Upper bound for joining another caller's in-flight request (covers retries)
+INFLIGHT_WAIT_TIMEOUT = 180
+
+# Parsed insights kept per prompt; the TTL bounds how stale a refresh can be
+RESPONSE_CACHE_SIZE = 64
+RESPONSE_CACHE_TTL = 600
+
+def _retry_after_seconds(response) -> Optional[float]:
+    """Parse a numeric Retry-After header, if the provider sent one."""
+    try:
+        return max(0.0, float(response.headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return None
 
 def retry_with_exponential_backoff(max_retries: int = 3, base_delay: float = 1.0):
     """
     Decorator for retry logic with exponential backoff.
     
+    Only network errors and 429/5xx responses are retried. A provider
+    Retry-After header takes precedence over the computed backoff.
+    ProvidersUnavailableError is raised at once: every provider circuit is
+    open, including after a failed half-open probe.
+    
     Args:
         max_retries: Maximum number of retry attempts
         base_delay: Base delay in seconds for exponential backoff
     """
     def decorator(func):
+        # Backoff schedule before jitter: base_delay, 2 * base_delay, 4 * base_delay, ...
+        backoff_delays = tuple(base_delay * (1 << attempt) for attempt in range(max_retries))
+        
+        @wraps(func)
         def wrapper(*args, **kwargs):
             last_exception = None
             
@@ -83,9 +142,22 @@ def retry_with_exponential_backoff(max_retries: int = 3, base_delay: float = 1.0
                 except Exception as e:
                     last_exception = e
                     
+                    if isinstance(e, ProvidersUnavailableError):
+                        security_logger.warning(f"API call rejected by open circuit breakers, not retrying: {e}")
+                        raise
+                    
+                    response = getattr(e, 'response', None)
+                    status_code = getattr(response, 'status_code', None)
+                    if status_code is not None and status_code not in RETRYABLE_STATUS_CODES:
+                        security_logger.error(f"API call failed with non-retryable status {status_code}: {e}")
+                        raise
+                    
                     if attempt < max_retries:
-                        # Exponential backoff with jitter
-                        delay = base_delay * (2 ** attempt) + random.uniform(0, 1)
+                        delay = _retry_after_seconds(response) if response is not None else None
+                        if delay is None:
+                            # Exponential backoff with jitter
+                            delay = backoff_delays[attempt] + random.random()
+                        delay = min(delay, MAX_RETRY_DELAY)
                         security_logger.warning(f"API call failed (attempt {attempt + 1}), retrying in {delay:.1f}s: {e}")
                         time.sleep(delay)
                     else:
@@ -95,6 +167,190 @@ def retry_with_exponential_backoff(max_retries: int = 3, base_delay: float = 1.0
         return wrapper
     return decorator
 
+# PII detection patterns, compiled once per process and shared by every
+# PIIScrubber. Purely numeric/hex patterns use re.ASCII so \d and \b only
+# consider ASCII characters.
+
+# Email patterns
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+# Phone number pattern: US formats, or E.164 international with a leading +
+_PHONE_RE = re.compile(
+    r'\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b|\+[1-9]\d{7,14}\b',
+    re.ASCII
+)
+
+# SSN patterns
+_SSN_RE = re.compile(r'\b\d{3}-?\d{2}-?\d{4}\b', re.ASCII)
+
+# Credit card candidates: 13-19 digits, optionally grouped with single spaces
+# or dashes; a match is only redacted if it passes the Luhn check
+_CC_RE = re.compile(r'\b\d(?:[ -]?\d){12,18}\b', re.ASCII)
+
+# Luhn value of each digit in the doubled positions
+_LUHN_DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+def _luhn_valid(number: str) -> bool:
+    """Check a card number candidate against the Luhn checksum."""
+    digits = number.replace(' ', '').replace('-', '')
+    total = sum(map(int, digits[-1::-2])) + sum(_LUHN_DOUBLED[int(digit)] for digit in digits[-2::-2])
+    return total % 10 == 0
+
+# IP address patterns
+_IP_RE = re.compile(r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b', re.ASCII)
+
+# MAC address patterns
+_MAC_RE = re.compile(r'\b(?:[0-9A-Fa-f]{2}[:-]){5}(?:[0-9A-Fa-f]{2})\b', re.ASCII)
+
+# Names that might be PII (common first/last name patterns)
+_NAME_RES = (
+    re.compile(r'\b[A-Z][a-z]+\s+[A-Z][a-z]+\b'),  # First Last
+)
+
+# Optional Hyperscan accelerator: one SIMD pass over the text reports which
+# PII types are present, so the re substitutions only run for those types.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# (PII type, re patterns) in scrubbing order; used to build the detector
+_PII_DETECTION_PATTERNS = (
+    ('email', (_EMAIL_RE,)),
+    ('phone', (_PHONE_RE,)),
+    ('ssn', (_SSN_RE,)),
+    ('credit_card', (_CC_RE,)),
+    ('ip_address', (_IP_RE,)),
+    ('mac_address', (_MAC_RE,)),
+    ('name', _NAME_RES),
+)
+
+# scrub_types config key and default for each PII type
+_PII_SCRUB_SETTINGS = {
+    'email': ('emails', True),
+    'phone': ('phones', True),
+    'ssn': ('ssns', True),
+    'credit_card': ('credit_cards', True),
+    'ip_address': ('ip_addresses', False),
+    'mac_address': ('mac_addresses', False),
+    'name': ('names', False),
+}
+
+@lru_cache(maxsize=None)
+def _combined_pii_pattern(pii_types: Tuple[str, ...]) -> Tuple[Pattern, Dict[str, str]]:
+    """
+    Fuse the patterns for the given PII types into one alternation.
+    
+    Each source pattern becomes a named group (keeping its own ASCII flag),
+    in scrubbing order, so a single sub() call replaces every type.
+    
+    Args:
+        pii_types: PII type names, in _PII_DETECTION_PATTERNS order
+        
+    Returns:
+        Tuple of (compiled pattern, group name -> PII type)
+    """
+    alternatives, group_types = [], {}
+    for pii_type, patterns in _PII_DETECTION_PATTERNS:
+        if pii_type not in pii_types:
+            continue
+        for index, pattern in enumerate(patterns):
+            group_name = f"{pii_type}_{index}"
+            flags = "(?a:" if pattern.flags & re.ASCII else "(?:"
+            alternatives.append(f"(?P<{group_name}>{flags}{pattern.pattern}))")
+            group_types[group_name] = pii_type
+    return re.compile("|".join(alternatives)), group_types
+
+# Fewest ASCII digits a match of each numeric PII type can contain, all within
+# one digit cluster (see _max_digit_cluster)
+_PII_MIN_DIGITS = {
+    'phone': 10,
+    'ssn': 9,
+    'credit_card': 13,
+    'ip_address': 4,
+}
+# The E.164 phone form is shorter but needs a literal '+'
+_INTL_PHONE_MIN_DIGITS = 8
+
+_NON_DIGIT_BYTES = bytes(b for b in range(256) if not 0x30 <= b <= 0x39)
+
+# Digits of one match are at most this many bytes apart, e.g. "1 (555" or
+# "555) 123"; a wider gap starts a new cluster
+_MAX_DIGIT_GAP = 3
+
+def _max_digit_cluster(text: str) -> int:
+    """
+    Count the digits in the largest cluster of closely spaced digits
+    
+    Vectorized over the UTF-8 bytes with numpy, so KPI prompts full of
+    short numbers (dates, percentages) can rule out phone, SSN and card
+    numbers without running their regexes.
+    
+    Args:
+        text: Text to scan
+        
+    Returns:
+        Digit count of the largest cluster; below 8 digits in total, the
+        total itself (an upper bound, which is all the prefilter needs)
+    """
+    encoded = text.encode('utf-8', 'surrogatepass')
+    # Short values like "99.5%" skip the fixed cost of the numpy pass
+    digit_count = len(encoded.translate(None, _NON_DIGIT_BYTES))
+    if digit_count < _INTL_PHONE_MIN_DIGITS:
+        return digit_count
+    buffer = np.frombuffer(encoded, dtype=np.uint8)
+    positions = np.flatnonzero((buffer >= 0x30) & (buffer <= 0x39))
+    if positions.size == 0:
+        return 0
+    breaks = np.flatnonzero(np.diff(positions) > _MAX_DIGIT_GAP) + 1
+    bounds = np.concatenate(([0], breaks, [positions.size]))
+    return int(np.diff(bounds).max())
+
+# Literal characters every match of a PII type must contain (any one of)
+_PII_REQUIRED_CHARS = {
+    'email': ('@',),
+    'ip_address': ('.',),
+    'mac_address': (':', '-'),
+}
+
+def _build_hyperscan_detector():
+    """
+    Compile all PII patterns into a single Hyperscan database.
+    
+    Word boundaries are dropped and Unicode classes enabled, so the detector
+    reports a superset of what the re patterns will match; it can cause an
+    unnecessary substitution pass but never a missed one.
+    
+    Returns:
+        Tuple of (database, pattern id -> PII type) or None if unavailable
+    """
+    if hyperscan is None:
+        return None
+    
+    expressions, id_types = [], []
+    for pii_type, patterns in _PII_DETECTION_PATTERNS:
+        for pattern in patterns:
+            expressions.append(pattern.pattern.replace(r'\b', '').encode('utf-8'))
+            id_types.append(pii_type)
+    
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP] * len(expressions),
+        )
+    except hyperscan.error as e:
+        security_logger.warning(f"Hyperscan PII detector unavailable, using re only: {e}")
+        return None
+    return database, tuple(id_types)
+
+_HYPERSCAN_DETECTOR = _build_hyperscan_detector()
+
+# Hyperscan scratch space must not be shared between concurrent scans
+_hyperscan_local = threading.local()
+
 class PIIScrubber:
     """
     PII scrubbing service for GDPR/CCPA compliance
@@ -164,32 +420,72 @@ class PIIScrubber:
         self.log_events = self.config['compliance']['log_scrubbing_events']
         
     def _compile_patterns(self):
-        """Compile regex patterns for PII detection"""
-        # Email patterns
-        self.email_pattern = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+        """Bind the module-level compiled regex patterns for PII detection"""
+        self.email_pattern = _EMAIL_RE
+        self.phone_pattern = _PHONE_RE
+        self.ssn_pattern = _SSN_RE
+        self.cc_pattern = _CC_RE
+        self.ip_pattern = _IP_RE
+        self.mac_pattern = _MAC_RE
+        self.name_patterns = _NAME_RES
+    
+    def _detect_pii_types(self, text: str) -> Set[str]:
+        """
+        Find which PII types may be present
+        
+        Uses the Hyperscan detector when available, otherwise the cheap
+        digit-count prefilter.
         
-        # Phone number patterns (US, international)
-        self.phone_patterns = [
-            re.compile(r'\b(?:\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})\b'),
-            re.compile(r'\b\+?[1-9]\d{1,14}\b'),  # International format
-        ]
+        Args:
+            text: Text to scan
+            
+        Returns:
+            Set of PII type names that may be present
+        """
+        if _HYPERSCAN_DETECTOR is None:
+            return self._prefilter_pii_types(text)
         
-        # SSN patterns
-        self.ssn_pattern = re.compile(r'\b\d{3}-?\d{2}-?\d{4}\b')
+        database, id_types = _HYPERSCAN_DETECTOR
+        scratch = getattr(_hyperscan_local, 'scratch', None)
+        if scratch is None:
+            scratch = _hyperscan_local.scratch = hyperscan.Scratch(database)
         
-        # Credit card patterns (basic Luhn algorithm check)
-        self.cc_pattern = re.compile(r'\b(?:4[0-9]{12}(?:[0-9]{3})?|5[1-5][0-9]{14}|3[47][0-9]{13}|3[0-9]{13}|6(?:011|5[0-9]{2})[0-9]{12})\b')
+        found = set()
+        def on_match(pattern_id, start, end, flags, context):
+            found.add(id_types[pattern_id])
         
-        # IP address patterns
-        self.ip_pattern = re.compile(r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b')
+        try:
+            database.scan(text.encode('utf-8'), match_event_handler=on_match, scratch=scratch)
+        except (UnicodeEncodeError, hyperscan.error) as e:
+            security_logger.debug("Hyperscan PII detection failed, falling back to re: %s", e)
+            return self._prefilter_pii_types(text)
+        return found
+    
+    def _prefilter_pii_types(self, text: str) -> Set[str]:
+        """
+        Rule out PII types whose required characters are missing
         
-        # MAC address patterns
-        self.mac_pattern = re.compile(r'\b(?:[0-9A-Fa-f]{2}[:-]){5}(?:[0-9A-Fa-f]{2})\b')
+        Numeric types need a minimum number of digits in one cluster of
+        closely spaced digits, found in a single vectorized pass; emails,
+        IPs and MACs need a literal separator, checked with str.__contains__.
+        Both are far cheaper than running the regexes over KPI prompts that
+        contain no PII.
         
-        # Names that might be PII (common first/last name patterns)
-        self.name_patterns = [
-            re.compile(r'\b[A-Z][a-z]+\s+[A-Z][a-z]+\b'),  # First Last
-        ]
+        Args:
+            text: Text to check
+            
+        Returns:
+            Set of PII type names that may be present
+        """
+        cluster_digits = _max_digit_cluster(text)
+        pii_types = {
+            pii_type for pii_type, _ in _PII_DETECTION_PATTERNS
+            if cluster_digits >= _PII_MIN_DIGITS.get(pii_type, 0)
+            and any(char in text for char in _PII_REQUIRED_CHARS.get(pii_type, ('',)))
+        }
+        if cluster_digits >= _INTL_PHONE_MIN_DIGITS and '+' in text:
+            pii_types.add('phone')
+        return pii_types
     
     def scrub_text(self, text: str) -> str:
         """
@@ -199,7 +495,8 @@ class PIIScrubber:
             text: Input text that may contain PII
             
         Returns:
-            Scrubbed text with PII removed/masked
+            Scrubbed text with PII removed/masked; the input object itself
+            when nothing was scrubbed
         """
         if not text or not isinstance(text, str):
             return text
@@ -208,62 +505,42 @@ class PIIScrubber:
         if not self.enabled:
             return text
         
-        scrubbed = text
         scrubbed_items = []
         
-        # Email scrubbing
-        if self.scrub_config.get('emails', True):
-            matches = self.email_pattern.findall(scrubbed)
-            if matches:
-                scrubbed_items.extend(['email'] * len(matches))
-                scrubbed = self.email_pattern.sub(self.replacements['email'], scrubbed)
-        
-        # Phone number scrubbing
-        if self.scrub_config.get('phones', True):
-            for pattern in self.phone_patterns:
-                matches = pattern.findall(scrubbed)
-                if matches:
-                    scrubbed_items.extend(['phone'] * len(matches))
-                    scrubbed = pattern.sub(self.replacements['phone'], scrubbed)
-        
-        # SSN scrubbing
-        if self.scrub_config.get('ssns', True):
-            matches = self.ssn_pattern.findall(scrubbed)
-            if matches:
-                scrubbed_items.extend(['ssn'] * len(matches))
-                scrubbed = self.ssn_pattern.sub(self.replacements['ssn'], scrubbed)
-        
-        # Credit card scrubbing
-        if self.scrub_config.get('credit_cards', True):
-            matches = self.cc_pattern.findall(scrubbed)
-            if matches:
-                scrubbed_items.extend(['credit_card'] * len(matches))
-                scrubbed = self.cc_pattern.sub(self.replacements['credit_card'], scrubbed)
-        
-        # IP address scrubbing (optional)
-        if self.scrub_config.get('ip_addresses', False):
-            matches = self.ip_pattern.findall(scrubbed)
-            if matches:
-                scrubbed_items.extend(['ip_address'] * len(matches))
-                scrubbed = self.ip_pattern.sub(self.replacements['ip_address'], scrubbed)
-        
-        # MAC address scrubbing (optional)
-        if self.scrub_config.get('mac_addresses', False):
-            matches = self.mac_pattern.findall(scrubbed)
-            if matches:
-                scrubbed_items.extend(['mac_address'] * len(matches))
-                scrubbed = self.mac_pattern.sub(self.replacements['mac_address'], scrubbed)
-        
-        # Name scrubbing (optional - very aggressive)
-        if self.scrub_config.get('names', False):
-            for pattern in self.name_patterns:
-                matches = pattern.findall(scrubbed)
-                if matches:
-                    scrubbed_items.extend(['name'] * len(matches))
-                    scrubbed = pattern.sub(self.replacements['name'], scrubbed)
+        # Skip PII types that are disabled or cannot be present
+        present = self._detect_pii_types(text)
+        active_types = tuple(
+            pii_type for pii_type, _ in _PII_DETECTION_PATTERNS
+            if pii_type in present and self.scrub_config.get(*_PII_SCRUB_SETTINGS[pii_type])
+        )
+        if not active_types:
+            return text
+        
+        # Single pass over the text for all remaining PII types
+        pattern, group_types = _combined_pii_pattern(active_types)
+        replacements = self.replacements
+        
+        def redact(match):
+            pii_type = group_types[match.lastgroup]
+            if pii_type == 'credit_card' and not _luhn_valid(match.group()):
+                # Not a card: scrub the span for the other types instead
+                if fallback_pattern is None:
+                    return match.group()
+                return fallback_pattern.sub(redact, match.group())
+            scrubbed_items.append(pii_type)
+            return replacements[pii_type]
+        
+        other_types = tuple(pii_type for pii_type in active_types if pii_type != 'credit_card')
+        fallback_pattern = _combined_pii_pattern(other_types)[0] if other_types else None
+        
+        scrubbed = pattern.sub(redact, text)
+        if not scrubbed_items:
+            # Only non-card digit runs matched; hand back the caller's object
+            # so identity checks stay O(1) and nothing is reported as scrubbed
+            return text
         
         # Log scrubbing events for compliance audit trail
-        if scrubbed_items and self.log_events:
+        if self.log_events:
             pii_types = ', '.join(set(scrubbed_items))
             pii_count = len(scrubbed_items)
             security_logger.info(f"PII scrubbed from text: {pii_count} items ({pii_types}) - GDPR/CCPA compliance")
@@ -291,7 +568,10 @@ class PIIScrubber:
     
     def scrub_data_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Recursively scrub PII from dictionary data
+        Scrub PII from nested dictionary data
+        
+        Walks nested dicts (and dicts inside lists) with an explicit stack
+        rather than recursion, building the scrubbed copy as it goes.
         
         Args:
             data: Dictionary that may contain PII in values
@@ -302,58 +582,292 @@ class PIIScrubber:
         if not isinstance(data, dict):
             return data
         
+        scrub_text = self.scrub_text
         scrubbed_data = {}
+        stack = [(data, scrubbed_data)]
         
-        for key, value in data.items():
-            if isinstance(value, str):
-                scrubbed_data[key] = self.scrub_text(value)
-            elif isinstance(value, dict):
-                scrubbed_data[key] = self.scrub_data_dict(value)
-            elif isinstance(value, list):
-                scrubbed_data[key] = [
-                    self.scrub_text(item) if isinstance(item, str) 
-                    else self.scrub_data_dict(item) if isinstance(item, dict)
-                    else item
-                    for item in value
-                ]
-            else:
-                scrubbed_data[key] = value
+        while stack:
+            source, target = stack.pop()
+            for key, value in source.items():
+                if isinstance(value, str):
+                    target[key] = scrub_text(value)
+                elif isinstance(value, dict):
+                    target[key] = child = {}
+                    stack.append((value, child))
+                elif isinstance(value, list):
+                    items = []
+                    for item in value:
+                        if isinstance(item, str):
+                            items.append(scrub_text(item))
+                        elif isinstance(item, dict):
+                            child = {}
+                            items.append(child)
+                            stack.append((item, child))
+                        else:
+                            items.append(item)
+                    target[key] = items
+                else:
+                    target[key] = value
         
         return scrubbed_data
 
+# Invariant fallback responses, shared by every rejected call. Callers must
+# treat them as read-only; list fields are tuples to discourage mutation.
+_CIRCUIT_OPEN_RESPONSE: Dict[str, Any] = {
+    "summary": "AI Insights temporarily unavailable due to service issues. Please try again later.",
+    "key_insights": ("Service is experiencing connectivity issues", "Circuit breaker is active to prevent cascade failures"),
+    "trends": ("Monitoring system health and API connectivity",),
+    "recommended_actions": ("Please refresh the page in a few minutes", "Check network connectivity", "Contact support if the issue persists"),
+}
+
+_TECHNICAL_ERROR_RESPONSE: Dict[str, Any] = {
+    "summary": "AI Insights temporarily unavailable due to technical issues. Please try again later.",
+    "key_insights": ("Service is experiencing technical difficulties",),
+    "trends": ("Monitoring service health and performance",),
+    "recommended_actions": ("Please refresh the page and try again", "Contact support if the issue persists"),
+}
+
+# System prompt sent with every insights request
+SYSTEM_PROMPT = """You are an expert telecommunications analyst AI. You MUST respond with valid JSON only. No explanatory text before or after the JSON.
+
+Analyze the KPI data and provide clear, actionable insights. Format your response as a JSON object with this exact structure:
+{
+  "summary": "One paragraph overview of key findings",
+  "key_insights": ["3-5 important observations"],
+  "trends": ["2-3 significant trends"],
+  "recommended_actions": ["3-5 specific, actionable recommendations"]
+}
+
+Focus on identifying patterns, anomalies, and suggesting specific corrective actions. Make your insights specific, data-driven, and actionable. Response must be valid JSON only."""
+
+# Gemini supports JSON responses well
+_JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Emoji prefixes for formatted insight sections
+_SUMMARY_PREFIX = "📊 "
+_INSIGHT_PREFIX = "💡 "
+_TREND_PREFIX = "📈 "
+_ACTION_PREFIX = "✅ "
+
+# Headers shared by every provider; Authorization is added per provider
+_BASE_HEADERS = {
+    "Content-Type": "application/json",
+    "HTTP-Referer": "https://github.com/your-repo/telecomdashboard",  # Required by OpenRouter
+}
+
+# Optional orjson codec for request bodies and responses; orjson.JSONDecodeError
+# subclasses json.JSONDecodeError, so the existing handlers cover both.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    _json_loads = json.loads
+
+# Keep-alive connection pool shared by all LLMService instances (the UI
+# creates a service per render, so a per-instance session would rarely be
+# reused). Retries are handled by retry_with_exponential_backoff.
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+def _get_session() -> requests.Session:
+    """Return the process-wide HTTP session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+class _ResponseCache:
+    """
+    Thread-safe LRU cache whose entries expire a fixed time after insertion.
+    
+    Cached values are shared between callers and must not be mutated.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the live value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: Any) -> None:
+        """Store value for key, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+# Shared like the HTTP session, so dashboard refreshes of an unchanged prompt
+# skip the LLM round-trip even though each render builds a new LLMService
+_response_cache = _ResponseCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL)
+
+# Requests currently in flight, keyed by LLMService._prompt_key; shared for the
+# same reason, so identical prompts from different renders and sessions join
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
 class LLMService:
     def __init__(self) -> None:
         self.config: Dict[str, Any] = get_llm_config()
         self.circuit_breaker = CircuitBreaker(failure_threshold=5, timeout=60)
         self.pii_scrubber = PIIScrubber()
         
+        # Per-call request settings, resolved once
+        self._temperature = self.config.get("temperature", 0.7)
+        self._max_tokens = self.config.get("max_tokens", 1000)
+        self._system_message = {"role": "system", "content": SYSTEM_PROMPT}
+        self._session = _get_session()
+        
+        # Provider pool for spreading load across keys/endpoints; each provider
+        # has its own breaker so one outage doesn't reject all traffic
+        self.providers: List[Dict[str, Any]] = self._build_providers(self.config)
+        self._breakers: Dict[str, CircuitBreaker] = {
+            provider['name']: CircuitBreaker(failure_threshold=5, timeout=60)
+            for provider in self.providers
+        }
+        self._provider_cycle = itertools.cycle([
+            provider for provider in self.providers
+            for _ in range(provider['weight'])
+        ])
+        self._provider_lock = threading.Lock()
+        
+        # The serving provider is only chosen at call time, so responses can
+        # be cached and shared only when every provider runs the same model
+        pool_models = {provider['model'] for provider in self.providers}
+        self._cache_model = pool_models.pop() if len(pool_models) == 1 else None
+        
+        self._inflight = _inflight
+        self._inflight_lock = _inflight_lock
+        self._response_cache = _response_cache
+    
+    @staticmethod
+    def _build_providers(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Build the provider pool from the LLM configuration.
+        
+        Entries under ``providers`` inherit any key they omit from the
+        top-level LLM settings. Without a ``providers`` list the top-level
+        settings form a single provider.
+        
+        Args:
+            config: LLM configuration section
+            
+        Returns:
+            List of provider dicts with name, api_key, api_base, model, weight,
+            and the precomputed request url and headers
+        """
+        defaults = {
+            'api_key': config.get('api_key'),
+            'api_base': config.get('api_base', 'https://openrouter.ai/api/v1'),
+            'model': config.get('model'),
+            'weight': 1,
+        }
+        entries = config.get('providers') or [{}]
+        
+        providers = []
+        for index, entry in enumerate(entries):
+            provider = {**defaults, **(entry or {})}
+            provider['weight'] = max(1, int(provider.get('weight') or 1))
+            provider.setdefault('name', f"{provider['api_base']}#{index}")
+            provider['url'] = f"{provider['api_base']}/chat/completions"
+            provider['headers'] = {**_BASE_HEADERS, "Authorization": f"Bearer {provider['api_key']}"}
+            providers.append(provider)
+        return providers
+    
+    def _next_provider(self) -> Optional[Dict[str, Any]]:
+        """
+        Pick the next provider in weighted round-robin order.
+        
+        Returns:
+            Provider dict, or None if every provider's circuit is open
+        """
+        with self._provider_lock:
+            for _ in range(sum(provider['weight'] for provider in self.providers)):
+                provider = next(self._provider_cycle)
+                if self._breakers[provider['name']].can_execute():
+                    return provider
+        return None
+        
     @retry_with_exponential_backoff(max_retries=3, base_delay=1.0)
-    def _make_api_call(self, headers: Dict[str, str], data: Dict[str, Any]) -> Dict[str, Any]:
+    def _make_api_call(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Make the actual API call with timeout and error handling.
         
+        Each attempt is routed to the next available provider, so retries
+        naturally move away from a failing key or endpoint.
+        
         Args:
-            headers: HTTP headers for the request
-            data: Request payload
+            data: Request payload; the provider's model is filled in
             
         Returns:
             API response data
             
         Raises:
+            requests.HTTPError: If the API returns a non-200 status
             requests.RequestException: If the API call fails
+            ProvidersUnavailableError: If every provider's circuit is open,
+                or a half-open probe failed with no other provider left
         """
-        response = requests.post(
-            f"{self.config['api_base']}/chat/completions",
-            headers=headers,
-            json=data,
-            timeout=30  # 30-second timeout
-        )
+        provider = self._next_provider()
+        if provider is None:
+            raise ProvidersUnavailableError("All LLM providers are unavailable")
+        breaker = self._breakers[provider['name']]
+        probing = breaker.state is _HALF_OPEN
+        security_logger.debug("Making API call to %s/chat/completions", provider['api_base'])
         
-        if response.status_code != 200:
-            error_msg = f"{response.status_code} - {response.text}"
-            raise requests.RequestException(f"API call failed: {error_msg}")
+        try:
+            data["model"] = provider['model']
+            response = self._session.post(
+                provider['url'],
+                headers=provider['headers'],
+                data=_json_dumps(data),
+                timeout=30  # 30-second timeout
+            )
+            
+            if response.status_code != 200:
+                error_msg = f"{response.status_code} - {response.text}"
+                raise requests.HTTPError(f"API call failed: {error_msg}", response=response)
+        except requests.RequestException as e:
+            breaker.record_failure()
+            # A failed probe reopens this provider's circuit; only retry if
+            # another provider could take the next attempt
+            if probing and not any(other.is_available() for other in self._breakers.values()):
+                raise ProvidersUnavailableError(f"Circuit probe failed and no provider is available: {e}") from e
+            raise
         
-        return response.json()
+        breaker.record_success()
+        return _json_loads(response.content)
 
     def generate_insights(self, prompt: str) -> Optional[Dict[str, Any]]:
         """
@@ -368,12 +882,7 @@ class LLMService:
         # Check circuit breaker before attempting call
         if not self.circuit_breaker.can_execute():
             security_logger.warning("Circuit breaker is OPEN - rejecting LLM API request")
-            return {
-                "summary": "AI Insights temporarily unavailable due to service issues. Please try again later.",
-                "key_insights": ["Service is experiencing connectivity issues", "Circuit breaker is active to prevent cascade failures"],
-                "trends": ["Monitoring system health and API connectivity"],
-                "recommended_actions": ["Please refresh the page in a few minutes", "Check network connectivity", "Contact support if the issue persists"]
-            }
+            return _CIRCUIT_OPEN_RESPONSE
         
         try:
             # Validate and sanitize input (use ai_prompt type for relaxed validation)
@@ -383,91 +892,24 @@ class LLMService:
             
             # Scrub PII from prompt for GDPR/CCPA compliance
             scrubbed_prompt = self.pii_scrubber.scrub_text(prompt)
-            if scrubbed_prompt != prompt:
+            if scrubbed_prompt is not prompt:
                 security_logger.info("PII detected and scrubbed from prompt for LLM compliance")
                 prompt = scrubbed_prompt
             
-            # Rate limiting check
-            if not security_manager.rate_limit_check("llm_api"):
-                security_logger.warning("Rate limit exceeded for LLM API")
-                return None
-            headers = {
-                "Authorization": f"Bearer {self.config['api_key']}",
-                "Content-Type": "application/json",
-                "HTTP-Referer": "https://github.com/your-repo/telecomdashboard",  # Required by OpenRouter
-            }
+            if self._cache_model is None:
+                # Mixed-model pool: bypass the response cache and coalescing
+                return self._request_insights(prompt, None)
             
-            data = {
-                "model": self.config["model"],
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": """You are an expert telecommunications analyst AI. You MUST respond with valid JSON only. No explanatory text before or after the JSON.
-
-Analyze the KPI data and provide clear, actionable insights. Format your response as a JSON object with this exact structure:
-{
-  "summary": "One paragraph overview of key findings",
-  "key_insights": ["3-5 important observations"],
-  "trends": ["2-3 significant trends"],
-  "recommended_actions": ["3-5 specific, actionable recommendations"]
-}
-
-Focus on identifying patterns, anomalies, and suggesting specific corrective actions. Make your insights specific, data-driven, and actionable. Response must be valid JSON only."""
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "temperature": self.config.get("temperature", 0.7),
-                "max_tokens": self.config.get("max_tokens", 1000),
-                "response_format": { "type": "json_object" }  # Gemini supports JSON responses well
-            }
-            
-            print(f"Making API call to {self.config['api_base']}/chat/completions")  # Debug log
-            
-            # Use the circuit breaker-protected API call
-            response_data = self._make_api_call(headers, data)
+            key = self._prompt_key(prompt)
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                security_logger.debug("Serving LLM insights from response cache")
+                return dict(cached)
             
-            print(f"API Response: {response_data}")  # Debug log
-            
-            # Parse the JSON string from the LLM response
-            content = response_data["choices"][0]["message"]["content"]
-            
-            # Log the content for debugging
-            security_logger.debug(f"LLM response content: {content[:200]}...")
-            
-            if not content or content.strip() == "":
-                security_logger.error("Empty response from LLM")
-                self.circuit_breaker.record_failure()
-                return None
-            
-            try:
-                insights = json.loads(content)
-                
-                # Basic validation of response structure
-                required_keys = ["summary", "key_insights", "trends", "recommended_actions"]
-                if not all(key in insights for key in required_keys):
-                    security_logger.warning("Incomplete response structure from LLM")
-                
-                # Record success for circuit breaker
-                self.circuit_breaker.record_success()
-                
-                # Return the insights directly (structured data doesn't need text sanitization)
-                return insights
-                
-            except json.JSONDecodeError as e:
-                security_logger.error(f"Failed to parse LLM response as JSON: {e}")
-                security_logger.error(f"Raw LLM response content: {content}")
-                self.circuit_breaker.record_failure()
-                
-                # Try to provide a fallback response
-                return {
-                    "summary": "Unable to process AI insights due to response format issue. Please check model configuration.",
-                    "key_insights": ["LLM response parsing failed", f"Model: {self.config.get('model', 'unknown')}", "Consider switching to a supported model"],
-                    "trends": ["Technical issue detected with current LLM configuration"],
-                    "recommended_actions": ["Check OpenRouter model availability", "Verify model name is correct", "Consider using openai/gpt-4-turbo as alternative"]
-                }
+            # Identical concurrent prompts share a single upstream request; the
+            # result is also the cached object, so every caller gets its own copy
+            insights = self._coalesce(key, lambda: self._request_insights(prompt, key))
+            return dict(insights) if insights is not None else None
             
         except requests.exceptions.ConnectionError as e:
             security_logger.error(f"LLM API connection error: {e}")
@@ -490,11 +932,137 @@ Focus on identifying patterns, anomalies, and suggesting specific corrective act
             # Record failure for circuit breaker
             self.circuit_breaker.record_failure()
             
+            return _TECHNICAL_ERROR_RESPONSE
+
+    def _prompt_key(self, prompt: str) -> str:
+        """
+        Build a stable key identifying a request for a (scrubbed) prompt.
+        
+        The serving model and sampling settings are part of the key so
+        requests that would produce different completions are never merged.
+        Only used when all providers share one model; pools with per-provider
+        model overrides that differ bypass the cache.
+        """
+        material = "\x00".join((
+            str(self._cache_model),
+            str(self._temperature),
+            str(self._max_tokens),
+            prompt,
+        ))
+        return hashlib.blake2b(material.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _coalesce(self, key: str, func: Callable[[], Any]) -> Any:
+        """
+        Run func once per key across concurrent callers.
+        
+        The first caller for a key performs the request; callers arriving
+        while it is in flight wait on the same future and receive its result
+        (or exception) instead of issuing a duplicate API call.
+        
+        Args:
+            key: Request key from _prompt_key
+            func: Callable performing the actual request
+            
+        Returns:
+            The result of func
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not is_leader:
+            security_logger.debug("Joining in-flight LLM request %.12s", key)
+            return future.result(timeout=INFLIGHT_WAIT_TIMEOUT)
+        
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    def _request_insights(self, prompt: str, cache_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Call the LLM for a validated, scrubbed prompt and parse the result.
+        
+        Complete insights are stored in the response cache under cache_key,
+        unless it is None.
+        
+        Args:
+            prompt: Prompt that has passed validation and PII scrubbing
+            cache_key: _prompt_key for the prompt, or None to skip caching
+            
+        Returns:
+            Dict containing structured insights or None if the call fails
+        """
+        # Rate limiting check
+        if not security_manager.rate_limit_check("llm_api"):
+            security_logger.warning("Rate limit exceeded for LLM API")
+            return None
+        data = {
+            "messages": [
+                self._system_message,
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "temperature": self._temperature,
+            "max_tokens": self._max_tokens,
+            "response_format": _JSON_RESPONSE_FORMAT
+        }
+        
+        # Use the circuit breaker-protected API call
+        response_data = self._make_api_call(data)
+        
+        security_logger.debug("API response received (%d choices)", len(response_data.get("choices", [])))
+        
+        # Parse the JSON string from the LLM response
+        content = response_data["choices"][0]["message"]["content"]
+        
+        # Log the content for debugging
+        security_logger.debug("LLM response content: %.200s...", content)
+        
+        if not content or content.strip() == "":
+            security_logger.error("Empty response from LLM")
+            self.circuit_breaker.record_failure()
+            return None
+        
+        try:
+            insights = _json_loads(content)
+            
+            # Basic validation of response structure
+            required_keys = ["summary", "key_insights", "trends", "recommended_actions"]
+            if not all(key in insights for key in required_keys):
+                security_logger.warning("Incomplete response structure from LLM")
+            elif cache_key is not None:
+                self._response_cache.set(cache_key, insights)
+            
+            # Record success for circuit breaker
+            self.circuit_breaker.record_success()
+            
+            # Return the insights directly (structured data doesn't need text sanitization)
+            return insights
+            
+        except json.JSONDecodeError as e:
+            security_logger.error(f"Failed to parse LLM response as JSON: {e}")
+            security_logger.error(f"Raw LLM response content: {content}")
+            self.circuit_breaker.record_failure()
+            
+            # Try to provide a fallback response
             return {
-                "summary": "AI Insights temporarily unavailable due to technical issues. Please try again later.",
-                "key_insights": ["Service is experiencing technical difficulties"],
-                "trends": ["Monitoring service health and performance"],
-                "recommended_actions": ["Please refresh the page and try again", "Contact support if the issue persists"]
+                "summary": "Unable to process AI insights due to response format issue. Please check model configuration.",
+                "key_insights": ["LLM response parsing failed", f"Model: {self.config.get('model', 'unknown')}", "Consider switching to a supported model"],
+                "trends": ["Technical issue detected with current LLM configuration"],
+                "recommended_actions": ["Check OpenRouter model availability", "Verify model name is correct", "Consider using openai/gpt-4-turbo as alternative"]
             }
 
     def format_insights_for_display(self, insights: Dict[str, Any]) -> Dict[str, Any]:
@@ -527,13 +1095,13 @@ Focus on identifying patterns, anomalies, and suggesting specific corrective act
             
         # Add emoji indicators and formatting, with safe defaults and text sanitization
         try:
-            from security_manager import sanitize_streamlit_output
+            sanitize = sanitize_streamlit_output
             
             formatted = {
-                "summary": f"📊 {sanitize_streamlit_output(insights.get('summary', 'No summary available'))}",
-                "key_insights": [f"💡 {sanitize_streamlit_output(insight)}" for insight in insights.get('key_insights', []) if isinstance(insight, str)],
-                "trends": [f"📈 {sanitize_streamlit_output(trend)}" for trend in insights.get('trends', []) if isinstance(trend, str)],
-                "recommended_actions": [f"✅ {sanitize_streamlit_output(action)}" for action in insights.get('recommended_actions', []) if isinstance(action, str)]
+                "summary": _SUMMARY_PREFIX + sanitize(insights.get('summary', 'No summary available')),
+                "key_insights": [_INSIGHT_PREFIX + sanitize(insight) for insight in insights.get('key_insights', ()) if type(insight) is str],
+                "trends": [_TREND_PREFIX + sanitize(trend) for trend in insights.get('trends', ()) if type(trend) is str],
+                "recommended_actions": [_ACTION_PREFIX + sanitize(action) for action in insights.get('recommended_actions', ()) if type(action) is str]
             }
             
             return formatted
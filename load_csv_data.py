@@ -4,35 +4,215 @@
 Loads all dimension and fact table CSV files into SQLite database
 """
 
+import csv
+import itertools
+import shutil
 import sqlite3
-import pandas as pd
+import subprocess
+import tempfile
 import os
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+# Rows read ahead from each CSV to choose column types before streaming the rest
+TYPE_SAMPLE_ROWS = 1000
+
+# sqlite3 command-line shell; when installed its C-level .import does the bulk load
+SQLITE3_CLI = shutil.which("sqlite3")
+
+def _infer_column_type(values):
+    """Pick INTEGER, REAL or TEXT for a column the way pandas.to_sql would"""
+    column_type = None
+    for value in values:
+        if value == "":
+            continue
+        if column_type in (None, "INTEGER"):
+            try:
+                int(value)
+                column_type = "INTEGER"
+                continue
+            except ValueError:
+                pass
+        try:
+            float(value)
+            column_type = "REAL"
+        except ValueError:
+            return "TEXT"
+    return column_type or "REAL"
+
+def _import_with_cli(csv_file, table_name, db_path):
+    """Bulk-load CSV rows (after the header) into an existing table with .import"""
+    script = (
+        "PRAGMA journal_mode=OFF;\n"
+        "PRAGMA synchronous=OFF;\n"
+        f'.import --csv --skip 1 "{csv_file}" "{table_name}"\n'
+    )
+    subprocess.run(
+        [SQLITE3_CLI, "-bail", db_path],
+        input=script, text=True, capture_output=True, check=True
+    )
 
 def load_csv_to_sqlite(csv_file, table_name, db_path):
-    """Load CSV file into SQLite table"""
+    """Stream CSV file into SQLite table, replacing any existing table"""
     try:
-        # Read CSV file
-        df = pd.read_csv(csv_file)
-        print(f"📁 Loading {csv_file} ({len(df)} rows) into {table_name}")
+        print(f"📁 Loading {csv_file} into {table_name}")
         
-        # Connect to database
-        conn = sqlite3.connect(db_path)
-        
-        # Load data into table
-        df.to_sql(table_name, conn, if_exists='replace', index=False)
-        
-        # Verify data was loaded
-        result = conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
-        print(f"✅ Successfully loaded {result} rows into {table_name}")
-        
-        conn.close()
+        # Autocommit mode so the load runs in one explicit transaction
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        try:
+            # Bulk-load settings: the table is rebuilt from CSV on failure anyway
+            conn.execute("PRAGMA journal_mode=OFF")
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            
+            with open(csv_file, newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader)
+                sample = list(itertools.islice(reader, TYPE_SAMPLE_ROWS))
+                columns = ", ".join(
+                    f'"{name}" {_infer_column_type(row[i] for row in sample)}'
+                    for i, name in enumerate(header)
+                )
+                placeholders = ", ".join("?" * len(header))
+                # Empty fields become NULL, matching pandas' NaN handling
+                rows = (
+                    [value if value != "" else None for value in row]
+                    for row in itertools.chain(sample, reader)
+                )
+                
+                conn.execute("BEGIN")
+                conn.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+                conn.execute(f'CREATE TABLE "{table_name}" ({columns})')
+                imported = False
+                if SQLITE3_CLI:
+                    conn.execute("COMMIT")
+                    try:
+                        _import_with_cli(csv_file, table_name, db_path)
+                        imported = True
+                    except (OSError, subprocess.CalledProcessError) as e:
+                        print(f"⚠️ sqlite3 .import failed for {csv_file}, loading row by row instead: {e}")
+                    conn.execute("BEGIN")
+                    if imported:
+                        # .import keeps empty fields as '' rather than NULL
+                        conn.execute(
+                            f'UPDATE "{table_name}" SET '
+                            + ", ".join(f'"{name}" = NULLIF("{name}", \'\')' for name in header)
+                            + " WHERE " + " OR ".join(f'"{name}" = \'\'' for name in header)
+                        )
+                    else:
+                        # Drop whatever the failed import wrote before bailing out
+                        conn.execute(f'DELETE FROM "{table_name}"')
+                if not imported:
+                    conn.executemany(f'INSERT INTO "{table_name}" VALUES ({placeholders})', rows)
+                conn.execute("COMMIT")
+            
+            # Verify data was loaded
+            result = conn.execute(f'SELECT COUNT(*) FROM "{table_name}"').fetchone()[0]
+            print(f"✅ Successfully loaded {result} rows into {table_name}")
+        finally:
+            conn.close()
         return True
         
     except Exception as e:
         print(f"❌ Error loading {csv_file}: {e}")
         return False
 
+def _load_to_staging(job):
+    """Load one CSV into its own staging database (runs in a worker process)"""
+    csv_file, table_name, staging_dir = job
+    staging_db = os.path.join(staging_dir, f"{table_name}.sqlite")
+    if load_csv_to_sqlite(csv_file, table_name, staging_db):
+        return staging_db
+    return None
+
+def _copy_from_staging(conn, staging_db, table_name):
+    """Replace table_name in the target database with its staged copy"""
+    conn.execute("ATTACH DATABASE ? AS staging", (staging_db,))
+    try:
+        create_sql = conn.execute(
+            "SELECT sql FROM staging.sqlite_master WHERE type = 'table' AND name = ?",
+            (table_name,)
+        ).fetchone()[0]
+        conn.execute("BEGIN")
+        conn.execute(f'DROP TABLE IF EXISTS main."{table_name}"')
+        conn.execute(create_sql)
+        conn.execute(f'INSERT INTO main."{table_name}" SELECT * FROM staging."{table_name}"')
+        conn.execute("COMMIT")
+    except Exception:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.execute("DETACH DATABASE staging")
+
+def load_csv_files(csv_files, db_path, max_workers=None):
+    """
+    Load CSV files into SQLite in parallel.
+    
+    Each worker process parses one CSV into a private staging database, so
+    parsing runs on all cores without contending for the target's write
+    lock; the staged tables are then copied into db_path in list order.
+    
+    Args:
+        csv_files: (csv_file, table_name) pairs
+        db_path: Target SQLite database
+        max_workers: Worker processes (defaults to one per file, capped at CPU count)
+        
+    Returns:
+        Number of files loaded successfully
+    """
+    if not csv_files:
+        return 0
+    
+    success_count = 0
+    with tempfile.TemporaryDirectory() as staging_dir:
+        jobs = [(csv_file, table_name, staging_dir) for csv_file, table_name in csv_files]
+        workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            staged = list(executor.map(_load_to_staging, jobs))
+        
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        try:
+            for (csv_file, table_name, _), staging_db in zip(jobs, staged):
+                if staging_db is None:
+                    continue
+                try:
+                    _copy_from_staging(conn, staging_db, table_name)
+                    success_count += 1
+                except Exception as e:
+                    print(f"❌ Error loading {csv_file}: {e}")
+        finally:
+            conn.close()
+    
+    return success_count
+
+def count_rows(conn, names):
+    """
+    Count rows in several tables or views with one query.
+    
+    If any object is missing or broken the combined query fails, so each
+    one is then counted on its own to report which failed.
+    
+    Args:
+        conn: Open SQLite connection
+        names: Table or view names
+        
+    Returns:
+        Dict of name -> row count, or the exception raised counting it
+    """
+    query = "SELECT " + ", ".join(f'(SELECT COUNT(*) FROM "{name}")' for name in names)
+    try:
+        return dict(zip(names, conn.execute(query).fetchone()))
+    except sqlite3.Error:
+        pass
+    
+    counts = {}
+    for name in names:
+        try:
+            counts[name] = conn.execute(f'SELECT COUNT(*) FROM "{name}"').fetchone()[0]
+        except sqlite3.Error as e:
+            counts[name] = e
+    return counts
+
 def main():
     """Main function to load all CSV files"""
     print("🚀 Telecom Data Warehouse - CSV Data Loader")
@@ -60,18 +240,18 @@ def main():
         ("data/fact_operations.csv", "fact_operations"),
     ]
     
-    # Track success/failure
-    success_count = 0
     total_count = len(csv_files)
     
-    # Load each CSV file
+    # Skip missing files, then load the rest in parallel
+    available_files = []
     for csv_file, table_name in csv_files:
         if os.path.exists(csv_file):
-            if load_csv_to_sqlite(csv_file, table_name, db_path):
-                success_count += 1
+            available_files.append((csv_file, table_name))
         else:
             print(f"⚠️  File not found: {csv_file}")
     
+    success_count = load_csv_files(available_files, db_path)
+    
     # Summary
     print("\n" + "=" * 50)
     print(f"📊 Data Loading Summary:")
@@ -91,26 +271,28 @@ def main():
             "fact_revenue", "fact_usage_adoption", "fact_operations"
         ]
         
-        for table in tables:
-            try:
-                count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
-                print(f"📋 {table}: {count} rows")
-            except Exception as e:
-                print(f"❌ {table}: Error - {e}")
-        
         # Check views
         views = [
             "vw_network_metrics_daily", "vw_customer_experience_daily",
             "vw_revenue_daily", "vw_usage_adoption_daily", "vw_operations_daily"
         ]
         
+        counts = count_rows(conn, tables + views)
+        
+        for table in tables:
+            count = counts[table]
+            if isinstance(count, Exception):
+                print(f"❌ {table}: Error - {count}")
+            else:
+                print(f"📋 {table}: {count} rows")
+        
         print("\n🔍 View Verification:")
         for view in views:
-            try:
-                count = conn.execute(f"SELECT COUNT(*) FROM {view}").fetchone()[0]
+            count = counts[view]
+            if isinstance(count, Exception):
+                print(f"❌ {view}: Error - {count}")
+            else:
                 print(f"📊 {view}: {count} rows")
-            except Exception as e:
-                print(f"❌ {view}: Error - {e}")
         
         conn.close()
     
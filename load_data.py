@@ -3,45 +3,95 @@ import sqlite3
 import os
 from datetime import datetime, timedelta
 
+# fact_network_metrics columns, in INSERT order
+FACT_COLUMNS = [
+    'network_element_id', 'region_id', 'date_id', 'hour', 'last_updated_ts',
+    'uptime_seconds', 'downtime_seconds', 'calls_attempted', 'calls_dropped',
+    'packets_sent', 'packets_lost', 'bandwidth_capacity_mb', 'bandwidth_used_mb',
+    'outage_minutes', 'repair_minutes', 'availability_percent', 'dropped_call_rate',
+    'latency_ms', 'latency_ms_p95', 'packet_loss_percent', 'bandwidth_utilization_percent', 'mttr_hours'
+]
+
+# Fact columns bound per row; last_updated_ts is shared by the whole load
+FACT_BOUND_COLUMNS = [column for column in FACT_COLUMNS if column != 'last_updated_ts']
+
+# Fact INSERT built once at import; only the load timestamp literal is filled in per load
+FACT_INSERT_SQL = (
+    f"INSERT INTO fact_network_metrics ({', '.join(FACT_COLUMNS)}) VALUES ("
+    + ', '.join("'{last_updated_ts}'" if column == 'last_updated_ts' else '?' for column in FACT_COLUMNS)
+    + ")"
+)
+
+# Fact CSV rows parsed and inserted per chunk, bounding peak memory
+FACT_CHUNK_SIZE = 50_000
+
+# Parse types for fact CSV columns stored as TEXT or REAL (float64 keeps values
+# exact); integer counters are inferred so a missing value still parses
+FACT_CSV_DTYPES = {
+    'date_id': str,
+    'bandwidth_capacity_mb': 'float64',
+    'bandwidth_used_mb': 'float64',
+    'outage_minutes': 'float64',
+    'repair_minutes': 'float64',
+    'availability_percent': 'float64',
+    'dropped_call_rate': 'float64',
+    'latency_ms': 'float64',
+    'latency_ms_p95': 'float64',
+    'packet_loss_percent': 'float64',
+    'bandwidth_utilization_percent': 'float64',
+    'mttr_hours': 'float64',
+}
+
+# Bound parameters per statement; 999 is the lowest SQLITE_MAX_VARIABLE_NUMBER default
+SQLITE_MAX_VARIABLES = 999
+
+def bulk_insert(cursor, table, columns, rows):
+    """Insert rows with multi-row VALUES statements, as few as the parameter limit allows"""
+    row_placeholders = f"({', '.join('?' * len(columns))})"
+    batch_size = SQLITE_MAX_VARIABLES // len(columns)
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start:start + batch_size]
+        cursor.execute(
+            f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES {', '.join([row_placeholders] * len(batch))}",
+            [value for row in batch for value in row]
+        )
+
 def create_dimension_data():
     """Create dimension data for regions, network elements, and time"""
     
-    # Create region dimension data
+    # Create region dimension data: (region_id, region_name)
     regions_data = [
-        {'region_id': 1, 'region_name': 'North Region'},
-        {'region_id': 2, 'region_name': 'South Region'},
-        {'region_id': 3, 'region_name': 'East Region'},
-        {'region_id': 4, 'region_name': 'West Region'},
-        {'region_id': 5, 'region_name': 'Central Region'}
+        (1, 'North Region'),
+        (2, 'South Region'),
+        (3, 'East Region'),
+        (4, 'West Region'),
+        (5, 'Central Region')
     ]
     
-    # Create network element dimension data
+    # Create network element dimension data:
+    # (network_element_id, element_name, element_type, vendor, install_date, region_id)
     network_elements_data = [
-        {'network_element_id': 1, 'element_name': 'Router-North-01', 'element_type': 'Router', 'vendor': 'Cisco', 'install_date': '2023-01-15', 'region_id': 1},
-        {'network_element_id': 2, 'element_name': 'Switch-South-01', 'element_type': 'Switch', 'vendor': 'Juniper', 'install_date': '2023-02-20', 'region_id': 2},
-        {'network_element_id': 3, 'element_name': 'Router-East-01', 'element_type': 'Router', 'vendor': 'Cisco', 'install_date': '2023-03-10', 'region_id': 3},
-        {'network_element_id': 4, 'element_name': 'Switch-West-01', 'element_type': 'Switch', 'vendor': 'Juniper', 'install_date': '2023-04-05', 'region_id': 4},
-        {'network_element_id': 5, 'element_name': 'Router-Central-01', 'element_type': 'Router', 'vendor': 'Cisco', 'install_date': '2023-05-12', 'region_id': 5}
+        (1, 'Router-North-01', 'Router', 'Cisco', '2023-01-15', 1),
+        (2, 'Switch-South-01', 'Switch', 'Juniper', '2023-02-20', 2),
+        (3, 'Router-East-01', 'Router', 'Cisco', '2023-03-10', 3),
+        (4, 'Switch-West-01', 'Switch', 'Juniper', '2023-04-05', 4),
+        (5, 'Router-Central-01', 'Router', 'Cisco', '2023-05-12', 5)
     ]
     
-    # Create time dimension data for the date range in the CSV
-    time_data = []
+    # Create time dimension data for the date range in the CSV, one row per hour:
+    # (date_id, hour, year, month, day, weekday, is_weekend)
     start_date = datetime(2023, 8, 1)
     end_date = datetime(2023, 8, 31)  # Assuming one month of data
-    
-    current_date = start_date
-    while current_date <= end_date:
-        for hour in range(24):
-            time_data.append({
-                'date_id': current_date.strftime('%Y-%m-%d'),
-                'hour': hour,
-                'year': current_date.year,
-                'month': current_date.month,
-                'day': current_date.day,
-                'weekday': current_date.strftime('%A'),
-                'is_weekend': 1 if current_date.weekday() >= 5 else 0
-            })
-        current_date += timedelta(days=1)
+    hours = pd.date_range(start_date, end_date + timedelta(days=1), freq='h', inclusive='left')
+    time_data = list(zip(
+        hours.strftime('%Y-%m-%d').tolist(),
+        hours.hour.tolist(),
+        hours.year.tolist(),
+        hours.month.tolist(),
+        hours.day.tolist(),
+        hours.day_name().tolist(),
+        (hours.weekday >= 5).astype(int).tolist()
+    ))
     
     return regions_data, network_elements_data, time_data
 
@@ -64,90 +114,84 @@ def load_data_to_sqlite():
         print(f"❌ CSV file not found: {csv_path}")
         return
     
-    # Connect to database
-    conn = sqlite3.connect(db_path)
+    # Connect to database; autocommit mode so the load runs in one explicit transaction
+    conn = sqlite3.connect(db_path, isolation_level=None)
     cursor = conn.cursor()
     
     try:
         # Create dimension data
         regions_data, network_elements_data, time_data = create_dimension_data()
         
+        # Bulk-load settings; they only last for this connection
+        cursor.executescript("""
+            PRAGMA synchronous=OFF;
+            PRAGMA journal_mode=MEMORY;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;
+        """)
+        cursor.execute("BEGIN")
+        
         # Load dimension tables
         print("📋 Loading dimension tables...")
         
         # Load regions
-        cursor.executemany(
-            "INSERT OR REPLACE INTO dim_region (region_id, region_name) VALUES (?, ?)",
-            [(r['region_id'], r['region_name']) for r in regions_data]
-        )
+        bulk_insert(cursor, 'dim_region', ['region_id', 'region_name'], regions_data)
         print(f"✅ Loaded {len(regions_data)} regions")
         
         # Load network elements
-        cursor.executemany(
-            "INSERT OR REPLACE INTO dim_network_element (network_element_id, element_name, element_type, vendor, install_date, region_id) VALUES (?, ?, ?, ?, ?, ?)",
-            [(ne['network_element_id'], ne['element_name'], ne['element_type'], ne['vendor'], ne['install_date'], ne['region_id']) for ne in network_elements_data]
+        bulk_insert(
+            cursor, 'dim_network_element',
+            ['network_element_id', 'element_name', 'element_type', 'vendor', 'install_date', 'region_id'],
+            network_elements_data
         )
         print(f"✅ Loaded {len(network_elements_data)} network elements")
         
         # Load time dimension
-        cursor.executemany(
-            "INSERT OR REPLACE INTO dim_time (date_id, hour, year, month, day, weekday, is_weekend) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            [(t['date_id'], t['hour'], t['year'], t['month'], t['day'], t['weekday'], t['is_weekend']) for t in time_data]
+        bulk_insert(
+            cursor, 'dim_time',
+            ['date_id', 'hour', 'year', 'month', 'day', 'weekday', 'is_weekend'],
+            time_data
         )
         print(f"✅ Loaded {len(time_data)} time records")
         
         # Load fact table data from CSV
         print("📈 Loading fact table data from CSV...")
         
-        # Read CSV data
-        df = pd.read_csv(csv_path)
-        
-        # Add last_updated_ts column
-        df['last_updated_ts'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        # Convert DataFrame to list of tuples for insertion
-        fact_data = []
-        for _, row in df.iterrows():
-            fact_data.append((
-                row['network_element_id'],
-                row['network_element_id'],  # Using network_element_id as region_id for simplicity
-                row['date_id'],
-                row['hour'],
-                row['last_updated_ts'],
-                row['uptime_seconds'],
-                row['downtime_seconds'],
-                row['calls_attempted'],
-                row['calls_dropped'],
-                row['packets_sent'],
-                row['packets_lost'],
-                row['bandwidth_capacity_mb'],
-                row['bandwidth_used_mb'],
-                row['outage_minutes'],
-                row['repair_minutes'],
-                row['availability_percent'],
-                row['dropped_call_rate'],
-                row['latency_ms'],
-                row.get('latency_ms_p95', row['latency_ms']),  # Use latency_ms if p95 not available
-                row['packet_loss_percent'],
-                row['bandwidth_utilization_percent'],
-                row['mttr_hours']
-            ))
-        
-        # Insert fact data
-        cursor.executemany("""
-            INSERT OR REPLACE INTO fact_network_metrics (
-                network_element_id, region_id, date_id, hour, last_updated_ts,
-                uptime_seconds, downtime_seconds, calls_attempted, calls_dropped,
-                packets_sent, packets_lost, bandwidth_capacity_mb, bandwidth_used_mb,
-                outage_minutes, repair_minutes, availability_percent, dropped_call_rate,
-                latency_ms, latency_ms_p95, packet_loss_percent, bandwidth_utilization_percent, mttr_hours
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, fact_data)
-        
-        print(f"✅ Loaded {len(fact_data)} fact records")
-        
-        # Commit changes
-        conn.commit()
+        # Every row shares one load timestamp, so it is written into the SQL as a
+        # literal rather than bound per row; the same SQL object is reused for every
+        # chunk so sqlite3's statement cache compiles it once
+        last_updated_ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        fact_sql = FACT_INSERT_SQL.format(last_updated_ts=last_updated_ts)
+        
+        # Full refresh: clear the table and drop its secondary indexes so rows are
+        # appended without per-row conflict checks or index maintenance
+        fact_indexes = cursor.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'fact_network_metrics' AND sql IS NOT NULL"
+        ).fetchall()
+        for index_name, _ in fact_indexes:
+            cursor.execute(f'DROP INDEX "{index_name}"')
+        cursor.execute("DELETE FROM fact_network_metrics")
+        
+        # Stream the CSV in chunks so memory stays bounded by the chunk size
+        fact_count = 0
+        for chunk in pd.read_csv(csv_path, chunksize=FACT_CHUNK_SIZE, dtype=FACT_CSV_DTYPES):
+            # Derive the columns the CSV lacks, vectorized over the chunk
+            chunk['region_id'] = chunk['network_element_id']  # Using network_element_id as region_id for simplicity
+            chunk['latency_ms_p95'] = chunk.get('latency_ms_p95', chunk['latency_ms']).fillna(chunk['latency_ms'])  # Use latency_ms if p95 not available
+            
+            # Rows in bound column order; executemany accepts the iterator directly
+            cursor.executemany(fact_sql, chunk.reindex(columns=FACT_BOUND_COLUMNS).itertuples(index=False, name=None))
+            fact_count += len(chunk)
+        
+        print(f"✅ Loaded {fact_count} fact records")
+        
+        # Rebuild the dropped indexes in one pass over the loaded rows
+        for _, index_sql in fact_indexes:
+            cursor.execute(index_sql)
+        
+        # Commit dimension and fact loads together
+        cursor.execute("COMMIT")
+        cursor.execute("ANALYZE fact_network_metrics")
         
         # Verify data loaded
         print("\n📊 Data verification:")
@@ -179,7 +223,8 @@ def load_data_to_sqlite():
         
     except Exception as e:
         print(f"❌ Error loading data: {e}")
-        conn.rollback()
+        if conn.in_transaction:
+            cursor.execute("ROLLBACK")
     finally:
         conn.close()
 
@@ -8,11 +8,14 @@ with different log levels, formatters, and handlers for different components.
 import logging
 import logging.handlers
 import sys
+import atexit
+import copy
+import queue
 import json
 import uuid
 import threading
 from pathlib import Path
-from typing import Dict, Optional, Union, Any
+from typing import Dict, Optional, Union
 from datetime import datetime, timezone
 
 # Thread-local storage for correlation IDs
@@ -50,7 +53,7 @@ class StructuredFormatter(logging.Formatter):
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
-            "correlation_id": get_correlation_id(),
+            "correlation_id": getattr(record, 'correlation_id', None) or get_correlation_id(),
             "thread_id": record.thread,
             "thread_name": record.threadName,
             "module": record.module,
@@ -77,6 +80,37 @@ class StructuredFormatter(logging.Formatter):
         
         return json.dumps(log_entry, default=str, ensure_ascii=False)
 
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that keeps the producer's context on queued records
+    
+    Records are formatted later on the QueueListener thread, so the caller's
+    correlation ID is stamped here, and exception info is kept for the
+    structured formatter instead of being folded into the message. The
+    handler owns its listener: closing it drains the queue, stops the writer
+    thread and closes the file.
+    """
+    
+    listener = None
+    
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.correlation_id = getattr(record, 'correlation_id', None) or get_correlation_id()
+        # Merge args on this thread, as the stock handler does, since they may
+        # change before the listener gets to the record
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+    
+    def close(self):
+        listener, self.listener = self.listener, None
+        if listener is not None:
+            atexit.unregister(self.close)
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        super().close()
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with color coding for different log levels"""
     
@@ -90,16 +124,25 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'       # Reset
     }
     
-    def format(self, record):
-        log_color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
-        reset_color = self.COLORS['RESET']
-        
-        # Format the timestamp
-        record.asctime = datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S')
+    def __init__(self, fmt=None, datefmt='%Y-%m-%d %H:%M:%S', style='%'):
+        # formatTime renders asctime with datefmt via time.strftime
+        super().__init__(fmt, datefmt=datefmt, style=style)
         
+        # Colored, padded level names built once rather than per record
+        reset_color = self.COLORS['RESET']
+        self._colored_levelnames = {
+            name: f"{color}{name:8}{reset_color}"
+            for name, color in self.COLORS.items() if name != 'RESET'
+        }
+    
+    def format(self, record):
         # Color the level name
         original_levelname = record.levelname
-        record.levelname = f"{log_color}{record.levelname:8}{reset_color}"
+        colored_levelname = self._colored_levelnames.get(original_levelname)
+        if colored_levelname is None:
+            reset_color = self.COLORS['RESET']
+            colored_levelname = f"{reset_color}{original_levelname:8}{reset_color}"
+        record.levelname = colored_levelname
         
         # Format the message
         formatted = super().format(record)
@@ -109,6 +152,13 @@ class ColoredFormatter(logging.Formatter):
         
         return formatted
 
+def _remove_queue_handlers(logger: logging.Logger):
+    """Detach and close a logger's queued file handlers"""
+    for handler in logger.handlers[:]:
+        if isinstance(handler, ContextQueueHandler):
+            logger.removeHandler(handler)
+            handler.close()
+
 class LoggingConfig:
     """Centralized logging configuration manager"""
     
@@ -135,6 +185,7 @@ class LoggingConfig:
         self.enable_colors = enable_colors
         self.structured_logging = structured_logging
         self._configured_loggers = set()
+        self._queue_handlers = []
         
         # Configure root logger
         self._setup_root_logger()
@@ -144,10 +195,15 @@ class LoggingConfig:
         root_logger = logging.getLogger()
         root_logger.setLevel(logging.DEBUG)
         
-        # Clear any existing handlers
+        # Clear any existing handlers, stopping the file writers of a previous
+        # configuration so reconfiguring does not leak threads or open files
+        _remove_queue_handlers(root_logger)
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
         
+        # Convenience-function loggers are resolved again against this setup
+        _helper_loggers.clear()
+        
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(self.console_level)
@@ -168,11 +224,19 @@ class LoggingConfig:
         console_handler.setFormatter(console_formatter)
         root_logger.addHandler(console_handler)
         
+        # Shared with component loggers that stop propagating to the root
+        self._console_handler = console_handler
+        
         # File handler for general logs
         self._add_file_handler(root_logger, "application.log")
     
     def _add_file_handler(self, logger: logging.Logger, filename: str):
-        """Add a rotating file handler to a logger"""
+        """
+        Add a rotating file handler to a logger
+        
+        The file handler runs on a QueueListener thread; the logger only gets a
+        QueueHandler, so callers never block on disk writes or rotation.
+        """
         log_file = self.log_dir / filename
         
         # Use RotatingFileHandler for automatic log rotation
@@ -192,7 +256,25 @@ class LoggingConfig:
                 '%(asctime)s | %(levelname)-8s | %(name)s | %(funcName)s:%(lineno)d | %(message)s'
             )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        
+        # One queue and writer thread per file, so each file keeps only its own records
+        log_queue = queue.Queue(-1)
+        queue_handler = ContextQueueHandler(log_queue)
+        queue_handler.setLevel(self.file_level)
+        queue_handler.listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+        queue_handler.listener.start()
+        atexit.register(queue_handler.close)
+        self._queue_handlers.append(queue_handler)
+        
+        # A logger set up by an earlier configuration keeps one file writer
+        _remove_queue_handlers(logger)
+        logger.addHandler(queue_handler)
+    
+    def stop(self):
+        """Flush queued records to disk and stop the file writer threads"""
+        for queue_handler in self._queue_handlers:
+            queue_handler.close()
+        self._queue_handlers.clear()
     
     def get_logger(self, name: str, 
                    level: Optional[Union[str, int]] = None,
@@ -225,21 +307,9 @@ class LoggingConfig:
             # Prevent propagation to avoid duplicate logs
             logger.propagate = False
             
-            # Add console handler for this specific logger
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setLevel(self.console_level)
-            
-            if self.enable_colors and sys.stdout.isatty():
-                console_formatter = ColoredFormatter(
-                    '%(asctime)s | %(levelname)s | %(name)s | %(message)s'
-                )
-            else:
-                console_formatter = logging.Formatter(
-                    '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s'
-                )
-            
-            console_handler.setFormatter(console_formatter)
-            logger.addHandler(console_handler)
+            # Reuse the root console handler so output is formatted once
+            if self._console_handler not in logger.handlers:
+                logger.addHandler(self._console_handler)
         
         self._configured_loggers.add(name)
         return logger
@@ -336,41 +406,65 @@ def configure_app_logging():
     
     return loggers
 
+# Loggers used by the convenience functions, resolved on first use
+_helper_loggers: Dict[str, logging.Logger] = {}
+
+def _get_helper_logger(name: str) -> logging.Logger:
+    """Get a logger for the convenience functions without re-resolving it per call"""
+    logger = _helper_loggers.get(name)
+    if logger is None:
+        logger = _helper_loggers[name] = get_logger(name)
+    return logger
+
 # Convenience functions for common logging patterns
 def log_performance(operation: str, duration: float, details: Optional[Dict] = None):
     """Log performance metrics"""
-    perf_logger = get_logger('performance')
-    message = f"{operation} completed in {duration:.3f}s"
+    perf_logger = _get_helper_logger('performance')
+    if not perf_logger.isEnabledFor(logging.INFO):
+        return
     if details:
-        message += f" | Details: {details}"
-    perf_logger.info(message)
+        perf_logger.info("%s completed in %.3fs | Details: %s", operation, duration, details)
+    else:
+        perf_logger.info("%s completed in %.3fs", operation, duration)
 
 def log_database_operation(operation: str, table: Optional[str] = None, 
                           duration: Optional[float] = None):
     """Log database operations"""
-    db_logger = get_logger('database')
-    message = f"Database operation: {operation}"
+    db_logger = _get_helper_logger('database')
+    if not db_logger.isEnabledFor(logging.INFO):
+        return
+    message = "Database operation: %s"
+    args = [operation]
     if table:
-        message += f" | Table: {table}"
+        message += " | Table: %s"
+        args.append(table)
     if duration:
-        message += f" | Duration: {duration:.3f}s"
-    db_logger.info(message)
+        message += " | Duration: %.3fs"
+        args.append(duration)
+    db_logger.info(message, *args)
 
 def log_security_event(event_type: str, details: str, level: str = "INFO"):
     """Log security events"""
-    security_logger = get_logger('security')
+    security_logger = _get_helper_logger('security')
     log_level = getattr(logging, level.upper())
-    security_logger.log(log_level, f"{event_type}: {details}")
+    if security_logger.isEnabledFor(log_level):
+        security_logger.log(log_level, "%s: %s", event_type, details)
 
 def log_ai_operation(operation: str, model: Optional[str] = None, 
                     tokens: Optional[int] = None, duration: Optional[float] = None):
     """Log AI/LLM operations"""
-    ai_logger = get_logger('ai_insights')
-    message = f"AI operation: {operation}"
+    ai_logger = _get_helper_logger('ai_insights')
+    if not ai_logger.isEnabledFor(logging.INFO):
+        return
+    message = "AI operation: %s"
+    args = [operation]
     if model:
-        message += f" | Model: {model}"
+        message += " | Model: %s"
+        args.append(model)
     if tokens:
-        message += f" | Tokens: {tokens}"
+        message += " | Tokens: %s"
+        args.append(tokens)
     if duration:
-        message += f" | Duration: {duration:.3f}s"
-    ai_logger.info(message)
+        message += " | Duration: %.3fs"
+        args.append(duration)
+    ai_logger.info(message, *args)
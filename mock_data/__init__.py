@@ -11,6 +11,7 @@ from .play_examples import (
     generate_usage_plays,
     generate_operations_plays,
     get_all_plays_by_area,
+    get_plays_for_area,
     get_random_plays_by_area,
     get_total_plays_count
 )
@@ -22,6 +23,7 @@ __all__ = [
     "generate_usage_plays",
     "generate_operations_plays",
     "get_all_plays_by_area",
+    "get_plays_for_area",
     "get_random_plays_by_area",
     "get_total_plays_count"
 ]
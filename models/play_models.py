@@ -7,12 +7,42 @@ This module defines the core data structures for the multi-agent system:
 - Agent: Base agent class with state management
 """
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from dataclasses import InitVar, dataclass, field
+from typing import Callable, List, Dict, Optional, Any, Sequence, Tuple
 from enum import Enum
 from datetime import datetime
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import sys
 import uuid
 
+import numpy as np
+
+# Optional orjson encoder for Portfolio.to_json; the json fallback unwraps NumPy
+# scalars and, like orjson's default here, stringifies anything else unsupported
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=str, option=option)
+else:
+    def _json_default(value: Any) -> Any:
+        return value.item() if isinstance(value, np.generic) else str(value)
+    
+    def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+        return json.dumps(obj, default=_json_default, indent=2 if indent else None).encode("utf-8")
+
+
+def _intern(value: Any) -> Any:
+    """Intern exact str values; anything else, str subclasses included, passes through"""
+    return sys.intern(value) if type(value) is str else value
+
 
 class PlayCategory(str, Enum):
     """Business initiative categories"""
@@ -44,7 +74,25 @@ class AgentStatus(str, Enum):
     PAUSED = "paused"
 
 
-@dataclass
+# Portfolio risk levels and the upper risk_score bound (inclusive) of each but the last
+RISK_LEVELS = ("Low", "Medium", "High")
+RISK_LEVEL_BOUNDS = (3.0, 6.0)
+
+# Priority-score thresholds for levels 4 (Low) up to 1 (Critical), ascending
+_PRIORITY_THRESHOLDS = (3.5, 5.0, 6.5, 8.0)
+
+# Batches at least this large are scored in chunks on a thread pool; NumPy
+# releases the GIL inside ufuncs, so the chunks run on separate cores
+_PARALLEL_SCORING_MIN_PLAYS = 1_000_000
+
+# Human-readable labels indexed by Play.priority_level (index 0 is unused)
+_PRIORITY_LABELS = ("Unknown", "Critical", "High", "Medium", "Low", "Minimal")
+
+# dataclass(slots=True) needs Python 3.10; older interpreters keep a per-instance __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Play:
     """Individual business initiative with scoring"""
     
@@ -68,13 +116,21 @@ class Play:
     # Business context
     estimated_cost: float = 0.0
     estimated_duration_months: int = 0
-    priority_level: int = 0
+    priority_level: int = 0  # Derived from the scores (1-5)
     
     # Metadata
     created_at: datetime = field(default_factory=datetime.now)
-    tags: List[str] = field(default_factory=list)
+    tags: Sequence[str] = field(default_factory=list)
     
-    def __post_init__(self):
+    # Serialized fields built on first to_dict, with the field values they were
+    # built from; see _cached_dict
+    _dict_cache: Optional[Tuple[tuple, Dict[str, Any]]] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Set only by bulk_create, whose priority_level is already derived from the
+    # scores; the public constructor always derives it
+    _priority_precomputed: InitVar[bool] = False
+    
+    def __post_init__(self, _priority_precomputed: bool):
         """Validate and compute derived fields"""
         # Ensure scores are within valid range
         self.impact_score = max(0.0, min(10.0, self.impact_score))
@@ -82,8 +138,14 @@ class Play:
         self.roi_score = max(0.0, min(10.0, self.roi_score))
         self.risk_score = max(0.0, min(10.0, self.risk_score))
         
-        # Compute priority level based on scoring
-        self.priority_level = self._calculate_priority()
+        # Titles and tags repeat across plays and portfolios, so intern them to
+        # share one string object per value; tuples of tags stay tuples
+        self.title = _intern(self.title)
+        self.tags = (tuple if isinstance(self.tags, tuple) else list)(_intern(tag) for tag in self.tags)
+        
+        # Compute priority level based on scoring, unless already computed in bulk
+        if not _priority_precomputed:
+            self.priority_level = self._calculate_priority()
     
     def _calculate_priority(self) -> int:
         """Calculate priority level (1-5) based on scoring"""
@@ -95,52 +157,142 @@ class Play:
             ((10 - self.risk_score) * 0.2)
         )
         
-        if priority_score >= 8.0:
-            return 1  # Critical
-        elif priority_score >= 6.5:
-            return 2  # High
-        elif priority_score >= 5.0:
-            return 3  # Medium
-        elif priority_score >= 3.5:
-            return 4  # Low
+        # Each threshold reached moves one level up from 5 (Minimal) towards 1 (Critical)
+        return 5 - bisect_right(_PRIORITY_THRESHOLDS, priority_score)
+    
+    @classmethod
+    def bulk_create(cls, records: Sequence[Dict[str, Any]]) -> List["Play"]:
+        """
+        Create many plays with one random read, one timestamp and one
+        vectorized priority calculation
+        
+        Args:
+            records: Play field values, one dict per play; an explicit id or
+                created_at in a record is kept
+            
+        Returns:
+            Plays in record order
+        """
+        random_bytes = os.urandom(16 * len(records))
+        created_at = datetime.now()
+        priority_levels = cls.priority_levels_for_scores(*(
+            [record.get(name, 0.0) for record in records]
+            for name in ("impact_score", "effort_score", "roi_score", "risk_score")
+        )).tolist()
+        return [
+            cls(**{
+                "id": str(uuid.UUID(bytes=random_bytes[offset:offset + 16], version=4)),
+                "created_at": created_at,
+                **record,
+                "priority_level": priority_level,
+                "_priority_precomputed": True
+            })
+            for offset, priority_level, record in zip(range(0, len(random_bytes), 16), priority_levels, records)
+        ]
+    
+    @staticmethod
+    def priority_levels_for_scores(impact_scores, effort_scores, roi_scores, risk_scores) -> np.ndarray:
+        """
+        Calculate priority levels for many plays at once
+        
+        Args:
+            impact_scores: Impact scores, one per play
+            effort_scores: Effort scores, one per play
+            roi_scores: ROI scores, one per play
+            risk_scores: Risk scores, one per play
+            
+        Returns:
+            Array of priority levels (1-5), matching Play.priority_level; very
+            large batches are split across threads
+        """
+        impact, effort, roi, risk = (
+            np.asarray(scores, dtype=float)
+            for scores in (impact_scores, effort_scores, roi_scores, risk_scores)
+        )
+        levels = np.empty(impact.shape, dtype=np.intp)
+        
+        def score_chunk(chunk):
+            # Same operation order as _calculate_priority, in place through two
+            # buffers, so each chunk is finished while it is still in cache
+            priority_scores = np.empty(levels[chunk].shape)
+            term = np.empty_like(priority_scores)
+            np.clip(impact[chunk], 0.0, 10.0, out=priority_scores)
+            priority_scores *= 0.3
+            np.clip(effort[chunk], 0.0, 10.0, out=term)
+            np.subtract(10, term, out=term)
+            term *= 0.2
+            priority_scores += term
+            np.clip(roi[chunk], 0.0, 10.0, out=term)
+            term *= 0.3
+            priority_scores += term
+            np.clip(risk[chunk], 0.0, 10.0, out=term)
+            np.subtract(10, term, out=term)
+            term *= 0.2
+            priority_scores += term
+            levels[chunk] = 5 - np.searchsorted(_PRIORITY_THRESHOLDS, priority_scores, side='right')
+        
+        workers = os.cpu_count() or 1
+        if levels.ndim != 1 or levels.size < _PARALLEL_SCORING_MIN_PLAYS or workers == 1:
+            score_chunk(...)
         else:
-            return 5  # Minimal
+            bounds = np.linspace(0, levels.size, workers + 1, dtype=np.int64)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(score_chunk, [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]))
+        return levels
     
     def get_priority_label(self) -> str:
         """Get human-readable priority label"""
-        labels = {
-            1: "Critical",
-            2: "High", 
-            3: "Medium",
-            4: "Low",
-            5: "Minimal"
-        }
-        return labels.get(self.priority_level, "Unknown")
+        if 1 <= self.priority_level <= 5:
+            return _PRIORITY_LABELS[self.priority_level]
+        return "Unknown"
+    
+    def _cached_dict(self) -> Dict[str, Any]:
+        """Shared serialization dictionary; only for encoders that do not keep it"""
+        # Score, rank and tags change during optimization, so they are patched
+        # in on every call; the other fields are compared against the values
+        # the dictionary was built from, and a change rebuilds it
+        source = (
+            self.id, self.title, self.description, self.category, self.subject_area,
+            self.impact_score, self.effort_score, self.roi_score, self.risk_score,
+            self.estimated_cost, self.estimated_duration_months, self.priority_level,
+            self.created_at
+        )
+        if self._dict_cache is None or self._dict_cache[0] != source:
+            self._dict_cache = (source, {
+                "id": self.id,
+                "title": self.title,
+                "description": self.description,
+                "category": self.category.value,
+                "subject_area": self.subject_area.value,
+                "impact_score": self.impact_score,
+                "effort_score": self.effort_score,
+                "roi_score": self.roi_score,
+                "risk_score": self.risk_score,
+                "score": self.score,
+                "rank": self.rank,
+                "estimated_cost": self.estimated_cost,
+                "estimated_duration_months": self.estimated_duration_months,
+                "priority_level": self.priority_level,
+                "priority_label": self.get_priority_label(),
+                "created_at": self.created_at.isoformat(),
+                "tags": self.tags
+            })
+        
+        data = self._dict_cache[1]
+        data["score"] = self.score
+        data["rank"] = self.rank
+        data["tags"] = self.tags
+        return data
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
-        return {
-            "id": self.id,
-            "title": self.title,
-            "description": self.description,
-            "category": self.category.value,
-            "subject_area": self.subject_area.value,
-            "impact_score": self.impact_score,
-            "effort_score": self.effort_score,
-            "roi_score": self.roi_score,
-            "risk_score": self.risk_score,
-            "score": self.score,
-            "rank": self.rank,
-            "estimated_cost": self.estimated_cost,
-            "estimated_duration_months": self.estimated_duration_months,
-            "priority_level": self.priority_level,
-            "priority_label": self.get_priority_label(),
-            "created_at": self.created_at.isoformat(),
-            "tags": self.tags
-        }
+        # Tags get a new list so callers cannot alter the cache
+        data = self._cached_dict().copy()
+        data["tags"] = list(self.tags)
+        return data
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Portfolio:
     """Collection of selected plays with optimization metrics"""
     
@@ -164,37 +316,81 @@ class Portfolio:
     optimization_parameters: Dict[str, Any] = field(default_factory=dict)
     executive_summary: str = ""
     
+    # Running totals over selected_plays, so add_play updates metrics in O(1)
+    _cost_sum: float = field(default=0.0, init=False, repr=False, compare=False)
+    _roi_weighted_sum: float = field(default=0.0, init=False, repr=False, compare=False)
+    _priority_sum: float = field(default=0.0, init=False, repr=False, compare=False)
+    _risk_counts: List[int] = field(
+        default_factory=lambda: [0] * len(RISK_LEVELS), init=False, repr=False, compare=False
+    )
+    
+    # Selected plays grouped by priority level and by category, in selection order
+    _plays_by_priority: Dict[int, List[Play]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _plays_by_category: Dict[PlayCategory, List[Play]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
     def __post_init__(self):
         """Calculate portfolio metrics"""
         self._calculate_portfolio_metrics()
+        self._index_plays()
         if not self.executive_summary:
             self.executive_summary = "AI-optimized portfolio summary will be generated during optimization."
     
     def _calculate_portfolio_metrics(self):
-        """Calculate portfolio-level metrics"""
+        """Recalculate portfolio-level metrics from all selected plays"""
+        self._risk_counts = [0] * len(RISK_LEVELS)
         if not self.selected_plays:
+            self._cost_sum = self._roi_weighted_sum = self._priority_sum = 0.0
+            self._publish_metrics()
             return
         
+        # One pass over the plays into column arrays, then vectorized reductions
+        count = len(self.selected_plays)
+        costs = np.fromiter((play.estimated_cost for play in self.selected_plays), dtype=float, count=count)
+        roi = np.fromiter((play.roi_score for play in self.selected_plays), dtype=float, count=count)
+        risk = np.fromiter((play.risk_score for play in self.selected_plays), dtype=float, count=count)
+        priority = np.fromiter((play.priority_level for play in self.selected_plays), dtype=float, count=count)
+        
+        self._cost_sum = float(costs.sum())
+        self._roi_weighted_sum = float(np.dot(roi, costs))
+        self._priority_sum = float(priority.sum())
+        
+        # Risk bins, the same as _get_risk_level
+        risk_counts = np.bincount(np.digitize(risk, RISK_LEVEL_BOUNDS, right=True), minlength=len(RISK_LEVELS))
+        self._risk_counts = [int(level_count) for level_count in risk_counts]
+        
+        self._publish_metrics()
+    
+    def _index_plays(self):
+        """Rebuild the priority and category indexes from all selected plays"""
+        self._plays_by_priority = {}
+        self._plays_by_category = {}
+        for play in self.selected_plays:
+            self._plays_by_priority.setdefault(play.priority_level, []).append(play)
+            self._plays_by_category.setdefault(play.category, []).append(play)
+    
+    def _publish_metrics(self):
+        """Set the metric fields from the running totals"""
         # Total investment
-        self.total_investment = sum(play.estimated_cost for play in self.selected_plays)
+        self.total_investment = self._cost_sum
         
         # Total ROI (weighted by cost)
-        total_cost = sum(play.estimated_cost for play in self.selected_plays)
-        if total_cost > 0:
-            self.total_roi = sum(
-                (play.roi_score * play.estimated_cost) for play in self.selected_plays
-            ) / total_cost
+        if self._cost_sum > 0:
+            self.total_roi = self._roi_weighted_sum / self._cost_sum
         else:
             self.total_roi = 0.0
         
         # Average priority
-        self.average_priority = sum(play.priority_level for play in self.selected_plays) / len(self.selected_plays)
+        if self.selected_plays:
+            self.average_priority = self._priority_sum / len(self.selected_plays)
+        else:
+            self.average_priority = 0.0
         
         # Risk distribution
-        self.risk_distribution = {}
-        for play in self.selected_plays:
-            risk_level = self._get_risk_level(play.risk_score)
-            self.risk_distribution[risk_level] = self.risk_distribution.get(risk_level, 0) + 1
+        self.risk_distribution = {
+            level: level_count for level, level_count in zip(RISK_LEVELS, self._risk_counts) if level_count
+        }
     
     def _get_risk_level(self, risk_score: float) -> str:
         """Convert risk score to risk level"""
@@ -207,36 +403,53 @@ class Portfolio:
     
     def add_play(self, play: Play, selected: bool = True):
         """Add a play to the portfolio"""
-        if selected:
-            self.selected_plays.append(play)
-        else:
+        if not selected:
             self.rejected_plays.append(play)
-        self._calculate_portfolio_metrics()
+            return
+        
+        self.selected_plays.append(play)
+        self._cost_sum += play.estimated_cost
+        self._roi_weighted_sum += play.roi_score * play.estimated_cost
+        self._priority_sum += play.priority_level
+        self._risk_counts[bisect_left(RISK_LEVEL_BOUNDS, play.risk_score)] += 1
+        self._publish_metrics()
+        self._plays_by_priority.setdefault(play.priority_level, []).append(play)
+        self._plays_by_category.setdefault(play.category, []).append(play)
     
     def remove_play(self, play_id: str, selected: bool = True):
         """Remove a play from the portfolio"""
-        if selected:
-            self.selected_plays = [p for p in self.selected_plays if p.id != play_id]
-        else:
+        if not selected:
             self.rejected_plays = [p for p in self.rejected_plays if p.id != play_id]
+            return
+        
+        remaining = [p for p in self.selected_plays if p.id != play_id]
+        if len(remaining) == len(self.selected_plays):
+            return
+        self.selected_plays = remaining
+        # Recompute rather than subtract, so float totals do not drift
         self._calculate_portfolio_metrics()
+        self._index_plays()
     
     def get_plays_by_priority(self, priority_level: int) -> List[Play]:
         """Get plays by priority level"""
-        return [play for play in self.selected_plays if play.priority_level == priority_level]
+        return list(self._plays_by_priority.get(priority_level, ()))
     
     def get_plays_by_category(self, category: PlayCategory) -> List[Play]:
         """Get plays by category"""
-        return [play for play in self.selected_plays if play.category == category]
+        return list(self._plays_by_category.get(category, ()))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
+        return self._build_dict(Play.to_dict)
+    
+    def _build_dict(self, play_to_dict: Callable[[Play], Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the portfolio dictionary with each play converted by play_to_dict"""
         return {
             "id": self.id,
             "name": self.name,
             "description": self.description,
-            "selected_plays": [play.to_dict() for play in self.selected_plays],
-            "rejected_plays": [play.to_dict() for play in self.rejected_plays],
+            "selected_plays": [play_to_dict(play) for play in self.selected_plays],
+            "rejected_plays": [play_to_dict(play) for play in self.rejected_plays],
             "total_investment": self.total_investment,
             "total_roi": self.total_roi,
             "average_priority": self.average_priority,
@@ -245,9 +458,15 @@ class Portfolio:
             "optimization_parameters": self.optimization_parameters,
             "executive_summary": self.executive_summary
         }
+    
+    def to_json(self, indent: bool = False) -> bytes:
+        """Serialize to UTF-8 JSON, using orjson when it is installed"""
+        # Plays are encoded straight from their cached dictionaries, skipping the
+        # defensive copies to_dict hands out
+        return _json_dumps(self._build_dict(Play._cached_dict), indent)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AgentState:
     """Agent execution state and progress"""
     
@@ -315,7 +534,7 @@ class WorkflowPhase(str, Enum):
     COMPLETED = "completed"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class WorkflowStatus:
     """Overall workflow status and progress"""
     
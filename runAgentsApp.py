@@ -6,18 +6,26 @@ with real-time progress visualization, portfolio optimization, and stunning UI.
 """
 
 import streamlit as st
+import heapq
+import re
+import threading
 import time
 import json
 import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime
 from typing import Dict, List, Any
+import numpy as np
 import pandas as pd
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 from agents.orchestrator import AgentOrchestrator, OrchestrationConfig
 from agents.mock_intelligence import get_mock_intelligence_engine
 from models.play_models import SubjectArea, Play, Portfolio, WorkflowPhase
 
+# Orchestrator statuses after which the live status view stops polling
+FINISHED_STATUSES = ('completed', 'failed')
+
 # Page configuration
 st.set_page_config(
     page_title="AI Agent Orchestration System",
@@ -26,8 +34,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for stunning visuals
-st.markdown("""
+# Custom CSS for stunning visuals, whitespace-collapsed once at import. Streamlit
+# drops elements a full rerun does not emit again, so it is sent on every full
+# run; live status fragment reruns leave it in place
+CUSTOM_CSS = re.sub(r"\s+", " ", """
 <style>
     .main-header {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 50%, #f093fb 100%);
@@ -107,6 +117,7 @@ st.markdown("""
         background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
         position: relative;
         overflow: hidden;
+        transition: width 0.3s ease;
     }
     
     .progress-bar::after {
@@ -137,6 +148,24 @@ st.markdown("""
         transition: all 0.3s ease;
     }
     
+    .phase-grid {
+        display: grid;
+        grid-template-columns: repeat(3, 1fr);
+        gap: 1rem;
+    }
+    
+    .agent-grid {
+        display: grid;
+        grid-template-columns: repeat(5, 1fr);
+        gap: 1rem;
+    }
+    
+    .metric-grid {
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 1rem;
+    }
+    
     .workflow-phase:hover {
         transform: translateY(-2px);
         box-shadow: 0 12px 35px rgba(0,0,0,0.2);
@@ -242,7 +271,11 @@ st.markdown("""
         background-color: #f8f9fa;
     }
 </style>
-""", unsafe_allow_html=True)
+""").strip()
+
+def apply_custom_css():
+    """Inject the app stylesheet without markdown processing"""
+    st.html(CUSTOM_CSS)
 
 def initialize_session_state():
     """Initialize session state variables"""
@@ -252,6 +285,8 @@ def initialize_session_state():
         st.session_state.orchestration_started = False
     if 'current_results' not in st.session_state:
         st.session_state.current_results = None
+    if 'orchestration_completed' not in st.session_state:
+        st.session_state.orchestration_completed = False
     if 'workflow_history' not in st.session_state:
         st.session_state.workflow_history = []
 
@@ -270,7 +305,12 @@ def create_orchestrator():
     
     orchestrator = AgentOrchestrator(config)
     
+    # The orchestrator calls back from its worker threads, which have no script
+    # context of their own; attach this session's so the history reaches it
+    script_ctx = get_script_run_ctx()
+    
     def progress_callback(progress: float, message: str):
+        add_script_run_ctx(threading.current_thread(), script_ctx)
         st.session_state.workflow_history.append({
             'timestamp': datetime.now(),
             'progress': progress,
@@ -278,6 +318,7 @@ def create_orchestrator():
         })
     
     def status_callback(message: str):
+        add_script_run_ctx(threading.current_thread(), script_ctx)
         st.session_state.workflow_history.append({
             'timestamp': datetime.now(),
             'progress': None,
@@ -299,25 +340,41 @@ def display_header():
     </div>
     """, unsafe_allow_html=True)
 
+# Workflow phases shown above the dashboard: (icon, title, description)
+WORKFLOW_PHASES = (
+    ("🔍", "Agent Analysis", "5 specialized agents analyzing business areas"),
+    ("⚡", "Portfolio Optimization", "AI-powered portfolio selection and scoring"),
+    ("📊", "Results Presentation", "Executive summary and actionable insights")
+)
+
+# The phase cards never change, so their grid is built once at import
+WORKFLOW_PHASES_HTML = '<div class="phase-grid">{}</div>'.format("".join(f"""
+    <div class="workflow-phase">
+        <h4>{icon} {title}</h4>
+        <p>{description}</p>
+    </div>""" for icon, title, description in WORKFLOW_PHASES))
+
+# Agent card CSS classes by agent status; other statuses use the plain card
+AGENT_CARD_CLASSES = {
+    'analyzing': "agent-card agent-working",
+    'completed': "agent-card agent-completed"
+}
+
+AGENT_CARD_TEMPLATE = """
+        <div class="{card_class}">
+            <h4><span class='agent-status-indicator status-{state}'></span>{name} Agent</h4>
+            <p><strong>Status:</strong> {state_label}</p>
+            <p><strong>Progress:</strong> {progress:.1%}</p>
+            <div class="progress-bar" style="width: {progress:.1%}"></div>
+            <p><strong>Task:</strong> {task}</p>
+        </div>"""
+
 def display_workflow_phases():
     """Display the workflow phases with visual indicators"""
     st.markdown("### 🚀 Workflow Execution Phases")
     
-    phases = [
-        ("🔍", "Agent Analysis", "5 specialized agents analyzing business areas"),
-        ("⚡", "Portfolio Optimization", "AI-powered portfolio selection and scoring"),
-        ("📊", "Results Presentation", "Executive summary and actionable insights")
-    ]
-    
-    cols = st.columns(len(phases))
-    for i, (icon, title, description) in enumerate(phases):
-        with cols[i]:
-            st.markdown(f"""
-            <div class="workflow-phase">
-                <h4>{icon} {title}</h4>
-                <p>{description}</p>
-            </div>
-            """, unsafe_allow_html=True)
+    # All phases in one CSS grid element instead of one element per column
+    st.html(WORKFLOW_PHASES_HTML)
 
 def display_workflow_diagram():
     """Display an interactive workflow diagram"""
@@ -359,76 +416,114 @@ def display_workflow_diagram():
     
     st.plotly_chart(fig, use_container_width=True)
 
-def display_agent_status(orchestrator):
+def display_agent_status(status_snapshot):
     """Display real-time agent status with stunning visuals"""
-    if not orchestrator:
+    if not status_snapshot:
         return
     
     st.markdown("### 🤖 Agent Status Dashboard")
     
-    # Get agent status
-    agent_status = orchestrator.get_status()
-    agents = agent_status.get('agents', {})
-    
-    # Create columns for agent cards
-    cols = st.columns(5)
-    
-    for i, (area, status) in enumerate(agents.items()):
-        with cols[i]:
-            # Determine card class based on status
-            card_class = "agent-card"
-            if status.get('status') == 'analyzing':
-                card_class += " agent-working"
-            elif status.get('status') == 'completed':
-                card_class += " agent-completed"
-            
-            # Get status indicator
-            status_indicator = f"<span class='agent-status-indicator status-{status.get('status', 'idle')}'></span>"
-            
-            st.markdown(f"""
-            <div class="{card_class}">
-                <h4>{status_indicator}{area.title()} Agent</h4>
-                <p><strong>Status:</strong> {status.get('status', 'idle').title()}</p>
-                <p><strong>Progress:</strong> {status.get('progress', 0):.1%}</p>
-                <p><strong>Task:</strong> {status.get('current_task', 'Idle')}</p>
-            </div>
-            """, unsafe_allow_html=True)
+    agents = status_snapshot.get('agents', {})
+    
+    # All agent cards, each with an inline progress bar, in one CSS grid element
+    # instead of one element per column
+    agent_cards = []
+    for area, status in agents.items():
+        state = status.get('status', 'idle')
+        agent_cards.append(AGENT_CARD_TEMPLATE.format_map({
+            'card_class': AGENT_CARD_CLASSES.get(state, "agent-card"),
+            'state': state,
+            'state_label': state.title(),
+            'name': area.title(),
+            'progress': status.get('progress', 0),
+            'task': status.get('current_task', 'Idle'),
+        }))
+    
+    st.html(f'<div class="agent-grid">{"".join(agent_cards)}</div>')
 
-def display_workflow_progress(orchestrator):
+def display_workflow_progress(status_snapshot):
     """Display workflow progress with real-time updates"""
-    if not orchestrator:
+    if not status_snapshot:
         return
     
     st.markdown("### 📈 Workflow Progress")
     
-    # Get workflow status
-    workflow_status = orchestrator.get_status()
-    current_phase = workflow_status.get('current_phase', 'initialization')
-    phase_progress = workflow_status.get('phase_progress', 0.0)
-    total_progress = workflow_status.get('total_progress', 0.0)
-    
-    # Display current phase
-    st.markdown(f"**Current Phase:** {current_phase.replace('_', ' ').title()}")
+    current_phase = status_snapshot.get('current_phase', 'initialization')
+    phase_progress = status_snapshot.get('phase_progress', 0.0)
+    total_progress = status_snapshot.get('total_progress', 0.0)
     
-    # Phase progress bar
-    st.markdown("**Phase Progress:**")
-    st.progress(phase_progress)
+    # Current phase and both progress bars as one HTML element; the bars are
+    # styled divs like the agent cards' rather than st.progress widgets
+    st.html(f"""
+    <p><strong>Current Phase:</strong> {current_phase.replace('_', ' ').title()}</p>
+    <p><strong>Phase Progress:</strong> {phase_progress:.1%}</p>
+    <div class="progress-bar" style="width: {phase_progress:.1%}"></div>
+    <p><strong>Overall Progress:</strong> {total_progress:.1%}</p>
+    <div class="progress-bar" style="width: {total_progress:.1%}"></div>""")
     
-    # Total progress bar
-    st.markdown("**Overall Progress:**")
-    st.progress(total_progress)
-    
-    # Display recent workflow history
+    # Display recent workflow history as a single element per tick
     if st.session_state.workflow_history:
-        st.markdown("**Recent Activity:**")
         recent_history = st.session_state.workflow_history[-10:]  # Last 10 entries
         
+        activity = ["**Recent Activity:**"]
         for entry in recent_history:
             timestamp = entry['timestamp'].strftime("%H:%M:%S")
             if entry['progress'] is not None:
-                st.markdown(f"🕐 **{timestamp}:** {entry['message']} ({entry['progress']:.1%})")
+                activity.append(f"🕐 **{timestamp}:** {entry['message']} ({entry['progress']:.1%})")
             else:
-                st.markdown(f"🕐 **{timestamp}:** {entry['message']}")
+                activity.append(f"🕐 **{timestamp}:** {entry['message']}")
+        st.markdown("\n\n".join(activity))
+
+@st.fragment(run_every=0.5)
+def display_live_status():
+    """Poll agent status and workflow progress without rerunning the whole page"""
+    orchestrator = st.session_state.orchestrator
+    if not orchestrator:
+        return
+    
+    # One status snapshot (and one orchestrator lock) per tick for every section
+    status_snapshot = orchestrator.get_status()
+    display_agent_status(status_snapshot)
+    display_workflow_progress(status_snapshot)
+    
+    # Hand over to a full run once finished, so main() renders the results and
+    # stops scheduling this fragment
+    if status_snapshot.get('status') in FINISHED_STATUSES:
+        st.rerun(scope="app")
+
+# Display formats for the numeric selected-plays columns
+PLAY_TABLE_COLUMN_CONFIG = {
+    'Impact': st.column_config.NumberColumn(format="%.1f"),
+    'Effort': st.column_config.NumberColumn(format="%.1f"),
+    'ROI': st.column_config.NumberColumn(format="%.1f"),
+    'Risk': st.column_config.NumberColumn(format="%.1f"),
+    'Score': st.column_config.NumberColumn(format="%.2f")
+}
+
+# Every orchestration run has a new portfolio id, so entries are bounded in
+# number and age rather than kept for the life of the server
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def build_plays_frame(portfolio_id: str, play_count: int, _plays: List[Play]) -> pd.DataFrame:
+    """Build the selected-plays table once per portfolio, keeping scores numeric"""
+    # Column by column, numeric ones straight into typed arrays, so pandas has no
+    # per-row records to infer columns and dtypes from
+    count = len(_plays)
+    return pd.DataFrame({
+        'Rank': np.fromiter((play.rank for play in _plays), dtype=np.int64, count=count),
+        'Title': [play.title for play in _plays],
+        'Area': [play.subject_area.value.title() for play in _plays],
+        'Impact': np.fromiter((play.impact_score for play in _plays), dtype=np.float64, count=count),
+        'Effort': np.fromiter((play.effort_score for play in _plays), dtype=np.float64, count=count),
+        'ROI': np.fromiter((play.roi_score for play in _plays), dtype=np.float64, count=count),
+        'Risk': np.fromiter((play.risk_score for play in _plays), dtype=np.float64, count=count),
+        'Score': np.fromiter((play.score for play in _plays), dtype=np.float64, count=count),
+        'Priority': [play.get_priority_label() for play in _plays]
+    })
+
+def get_final_portfolio(orchestrator):
+    """Get the optimized portfolio, falling back to the initial one"""
+    optimized = orchestrator.optimized_portfolio
+    return optimized if optimized is not None else orchestrator.initial_portfolio
 
 def display_portfolio_results(portfolio):
     """Display portfolio results with interactive charts"""
@@ -437,65 +532,46 @@ def display_portfolio_results(portfolio):
     
     st.markdown("### 🎯 Portfolio Optimization Results")
     
-    # Portfolio overview metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(f"""
+    # Portfolio overview metrics in one CSS grid element instead of four columns
+    st.html(f"""
+    <div class="metric-grid">
         <div class="metric-highlight">
             <h4>Total Plays</h4>
             <h2>{len(portfolio.selected_plays)}</h2>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
         <div class="metric-highlight">
             <h4>Total Investment</h4>
             <h2>${portfolio.total_investment:,.0f}</h2>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown(f"""
         <div class="metric-highlight">
             <h4>Average ROI</h4>
             <h2>{portfolio.total_roi:.1f}%</h2>
         </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown(f"""
         <div class="metric-highlight">
             <h4>Risk Level</h4>
             <h2>{portfolio.risk_distribution.get('Medium', 0)}</h2>
         </div>
-        """, unsafe_allow_html=True)
+    </div>""")
     
     # Portfolio plays table
     if portfolio.selected_plays:
         st.markdown("#### 📋 Selected Plays")
         
         # Prepare data for table
-        plays_data = []
-        for play in portfolio.selected_plays:
-            plays_data.append({
-                'Rank': play.rank,
-                'Title': play.title,
-                'Area': play.subject_area.value.title(),
-                'Impact': f"{play.impact_score:.1f}",
-                'Effort': f"{play.effort_score:.1f}",
-                'ROI': f"{play.roi_score:.1f}",
-                'Risk': f"{play.risk_score:.1f}",
-                'Score': f"{play.score:.2f}",
-                'Priority': play.get_priority_label()
-            })
-        
-        df = pd.DataFrame(plays_data)
+        df = build_plays_frame(portfolio.id, len(portfolio.selected_plays), portfolio.selected_plays)
         st.markdown('<div class="play-table">', unsafe_allow_html=True)
-        st.dataframe(df, use_container_width=True)
+        st.dataframe(df, use_container_width=True, column_config=PLAY_TABLE_COLUMN_CONFIG)
         st.markdown('</div>', unsafe_allow_html=True)
         
+        # Serialized only when clicked; "ignore" skips the app rerun on download
+        st.download_button(
+            "📥 Download Portfolio JSON",
+            data=lambda: portfolio.to_json(indent=True),
+            file_name=f"portfolio_{portfolio.id}.json",
+            mime="application/json",
+            on_click="ignore"
+        )
+        
         # Create scoring distribution chart
         st.markdown("#### 📊 Scoring Distribution")
         
@@ -524,6 +600,13 @@ def display_executive_summary(portfolio):
     
     st.markdown("### 📋 Executive Summary")
     
+    # Top 3 plays in one pass over the portfolio instead of a full sort
+    top_plays = heapq.nsmallest(3, portfolio.selected_plays, key=lambda x: x.rank)
+    recommendations = "".join(
+        f"<li><strong>{play.title}</strong> - {play.description[:100]}...</li>" for play in top_plays
+    )
+    
+    # The whole summary goes out as one element so the list stays inside its <ul>
     st.markdown(f"""
     <div class="executive-summary">
         <h4>🎯 Portfolio Overview</h4>
@@ -535,16 +618,7 @@ def display_executive_summary(portfolio):
         Expected ROI: <strong>{portfolio.total_roi:.1f}%</strong></p>
         
         <h4>🚀 Top Recommendations</h4>
-        <ul>
-    """, unsafe_allow_html=True)
-    
-    # Display top 3 plays
-    top_plays = sorted(portfolio.selected_plays, key=lambda x: x.rank)[:3]
-    for play in top_plays:
-        st.markdown(f"<li><strong>{play.title}</strong> - {play.description[:100]}...</li>", unsafe_allow_html=True)
-    
-    st.markdown("""
-        </ul>
+        <ul>{recommendations}</ul>
         
         <h4>⏱️ Implementation Timeline</h4>
         <p>Recommended implementation sequence prioritizes high-impact, low-effort initiatives 
@@ -556,14 +630,17 @@ def display_control_panel():
     """Display the control panel for orchestrating agents"""
     st.sidebar.markdown("### 🎮 Control Panel")
     
-    # Orchestration controls
-    if st.sidebar.button("🚀 Start Agent Orchestration", type="primary", use_container_width=True):
+    # Orchestration controls; a click while a run is in progress (e.g. a double
+    # click) must not start a second orchestration
+    if (st.sidebar.button("🚀 Start Agent Orchestration", type="primary", use_container_width=True)
+            and not st.session_state.orchestration_started):
         if not st.session_state.orchestrator:
             st.session_state.orchestrator = create_orchestrator()
         
         # Start orchestration in a separate thread
         if st.session_state.orchestrator.start_orchestration():
             st.session_state.orchestration_started = True
+            st.session_state.orchestration_completed = False
             st.rerun()
     
     if st.sidebar.button("⏹️ Stop Orchestration", use_container_width=True):
@@ -576,6 +653,7 @@ def display_control_panel():
         st.session_state.orchestrator = None
         st.session_state.orchestration_started = False
         st.session_state.current_results = None
+        st.session_state.orchestration_completed = False
         st.session_state.workflow_history = []
         st.rerun()
     
@@ -601,6 +679,7 @@ def display_control_panel():
 def main():
     """Main application function"""
     initialize_session_state()
+    apply_custom_css()
     
     # Display header
     display_header()
@@ -616,20 +695,29 @@ def main():
     
     # Main content area
     if st.session_state.orchestrator and st.session_state.orchestration_started:
-        # Display agent status
-        display_agent_status(st.session_state.orchestrator)
-        
-        # Display workflow progress
-        display_workflow_progress(st.session_state.orchestrator)
+        status = st.session_state.orchestrator.get_status()
+        if status.get('status') not in FINISHED_STATUSES:
+            # Live agent status and workflow progress, refreshed on their own
+            display_live_status()
+        else:
+            # Display final agent status
+            display_agent_status(status)
+            
+            # Display final workflow progress
+            display_workflow_progress(status)
         
         # Check if orchestration is complete
-        status = st.session_state.orchestrator.get_status()
         if status.get('status') == 'completed':
-            # Get results
-            results = st.session_state.orchestrator.get_results()
-            if results and 'portfolio' in results:
-                portfolio = results['portfolio']
-                st.session_state.current_results = portfolio
+            # Pick the final portfolio once; later reruns reuse the stored object
+            # instead of going back to the orchestrator
+            if not st.session_state.orchestration_completed:
+                portfolio = get_final_portfolio(st.session_state.orchestrator)
+                if portfolio is not None:
+                    st.session_state.current_results = portfolio
+                    st.session_state.orchestration_completed = True
+            
+            if st.session_state.orchestration_completed:
+                portfolio = st.session_state.current_results
                 
                 # Display results
                 display_portfolio_results(portfolio)
@@ -27,6 +27,18 @@ logging.basicConfig(
 
 security_logger = logging.getLogger('security')
 
+# Patterns used on every LLM prompt/response, compiled once per process
+_AI_PROMPT_DANGEROUS_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r"union\s+select.*from", r"drop\s+table", r"delete\s+from.*where", 
+        r"insert\s+into.*values", r"update.*set.*where", r"create\s+table",
+        r"alter\s+table", r"exec\s*\(", r"execute\s*\("
+    )
+)
+_SCRIPT_TAG_RE = re.compile(r'<script.*?</script>', re.DOTALL | re.IGNORECASE)
+_JAVASCRIPT_SCHEME_RE = re.compile(r'javascript:', re.IGNORECASE)
+_VBSCRIPT_SCHEME_RE = re.compile(r'vbscript:', re.IGNORECASE)
+
 class SecurityManager:
     """Centralized security manager for the application"""
     
@@ -117,16 +129,10 @@ class SecurityManager:
                 return False
                 
             # Only check for dangerous SQL patterns (not common text patterns)
-            dangerous_patterns = [
-                r"union\s+select.*from", r"drop\s+table", r"delete\s+from.*where", 
-                r"insert\s+into.*values", r"update.*set.*where", r"create\s+table",
-                r"alter\s+table", r"exec\s*\(", r"execute\s*\("
-            ]
-            
             prompt_str = str(prompt).lower()
-            for pattern in dangerous_patterns:
-                if re.search(pattern, prompt_str, re.IGNORECASE):
-                    security_logger.warning(f"Potentially dangerous pattern in AI prompt: {pattern}")
+            for pattern in _AI_PROMPT_DANGEROUS_PATTERNS:
+                if pattern.search(prompt_str):
+                    security_logger.warning(f"Potentially dangerous pattern in AI prompt: {pattern.pattern}")
                     return False
                     
             return True
@@ -274,9 +280,9 @@ def sanitize_streamlit_output(text: str) -> str:
         text = str(text)
     
     # Remove potentially dangerous content
-    text = re.sub(r'<script.*?</script>', '', text, flags=re.DOTALL | re.IGNORECASE)
-    text = re.sub(r'javascript:', '', text, flags=re.IGNORECASE)
-    text = re.sub(r'vbscript:', '', text, flags=re.IGNORECASE)
+    text = _SCRIPT_TAG_RE.sub('', text)
+    text = _JAVASCRIPT_SCHEME_RE.sub('', text)
+    text = _VBSCRIPT_SCHEME_RE.sub('', text)
     
     # HTML encode dangerous characters but preserve basic formatting
     text = text.replace('<', '&lt;').replace('>', '&gt;')
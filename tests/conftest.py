@@ -2,6 +2,7 @@
 Pytest configuration and shared fixtures for Telecom Dashboard tests
 """
 
+import json
 import pytest
 import sqlite3
 import tempfile
@@ -16,6 +17,7 @@ from datetime import datetime, timedelta
 sys.path.insert(0, str(Path(__file__).parent.parent))
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+import llm_service
 from database_connection import TelecomDatabase
 from config_manager import ConfigManager, AppConfig
 from src.models.data_models import (
@@ -210,20 +212,26 @@ def mock_llm_response():
 @pytest.fixture
 def mock_requests():
     """Mock requests for API calls"""
-    with patch('requests.post') as mock_post:
+    with patch('requests.Session.post') as mock_post:
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             'id': 'test-id',
             'choices': [{
                 'message': {
                     'content': '{"summary": "Test summary", "key_insights": ["Test insight"], "trends": ["Test trend"], "recommended_actions": ["Test action"]}'
                 }
             }]
-        }
+        }).encode()
         mock_post.return_value = mock_response
         yield mock_post
 
+@pytest.fixture(autouse=True)
+def clear_llm_response_cache():
+    """Keep cached LLM insights from leaking between tests"""
+    yield
+    llm_service._response_cache.clear()
+
 # Data model fixtures
 @pytest.fixture
 def sample_kpi_metric():
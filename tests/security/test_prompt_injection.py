@@ -5,6 +5,7 @@ Tests for AI prompt injection vulnerabilities and input validation.
 Ensures the LLM service properly handles malicious prompts and maintains security.
 """
 
+import json
 import pytest
 import sys
 import os
@@ -100,7 +101,7 @@ class TestPromptInjectionSecurity:
             ("Social Security: 987654321", "Social Security: [SSN_REDACTED]"),
             
             # Credit Card Numbers
-            ("Card: 4532-1234-5678-9012", "Card: [CREDIT_CARD_REDACTED]"),
+            ("Card: 4532-0151-1283-0366", "Card: [CREDIT_CARD_REDACTED]"),
             ("Payment: 5555555555554444", "Payment: [CREDIT_CARD_REDACTED]"),
             
             # Names (common patterns)
@@ -177,7 +178,7 @@ class TestPromptInjectionSecurity:
             assert isinstance(result, dict)
             assert "summary" in result
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_llm_api_response_validation(self, mock_post, llm_service):
         """Test validation of LLM API responses"""
         # Test malicious API response
@@ -192,9 +193,9 @@ class TestPromptInjectionSecurity:
         
         for malicious_response in malicious_responses:
             mock_post.return_value.status_code = 200
-            mock_post.return_value.json.return_value = {
+            mock_post.return_value.content = json.dumps({
                 "choices": [{"message": {"content": malicious_response}}]
-            }
+            }).encode()
             
             result = llm_service.generate_insights("Test prompt")
             
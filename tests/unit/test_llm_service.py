@@ -0,0 +1,398 @@
+"""
+Unit tests for LLM service module
+"""
+
+import json
+import pytest
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import llm_service as llm_service_module
+from llm_service import LLMService, CircuitBreaker, CircuitBreakerState, PIIScrubber, ProvidersUnavailableError
+
+
+@pytest.fixture
+def llm_service():
+    """Create LLM service with a two-provider pool"""
+    config = {
+        'api_key': 'default-key',
+        'api_base': 'https://primary.example/v1',
+        'model': 'test-model',
+        'providers': [
+            {'name': 'primary', 'weight': 2},
+            {'name': 'secondary', 'api_key': 'secondary-key', 'api_base': 'https://secondary.example/v1'},
+        ],
+    }
+    with patch('llm_service.get_llm_config', return_value=config):
+        return LLMService()
+
+
+class TestProviderPool:
+    """Test provider pool construction and routing"""
+
+    def test_single_provider_from_top_level_config(self):
+        """Test that a config without providers yields one provider"""
+        providers = LLMService._build_providers({'api_key': 'key', 'api_base': 'https://api.example/v1', 'model': 'm'})
+
+        assert len(providers) == 1
+        assert providers[0]['api_key'] == 'key'
+        assert providers[0]['weight'] == 1
+
+    def test_providers_inherit_top_level_settings(self, llm_service):
+        """Test that provider entries fall back to top-level settings"""
+        primary, secondary = llm_service.providers
+
+        assert primary['api_key'] == 'default-key'
+        assert primary['api_base'] == 'https://primary.example/v1'
+        assert secondary['api_key'] == 'secondary-key'
+        assert secondary['model'] == 'test-model'
+        assert secondary['url'] == 'https://secondary.example/v1/chat/completions'
+        assert secondary['headers']['Authorization'] == 'Bearer secondary-key'
+
+    def test_weighted_round_robin(self, llm_service):
+        """Test that providers are picked in proportion to their weight"""
+        picks = [llm_service._next_provider()['name'] for _ in range(6)]
+
+        assert picks.count('primary') == 4
+        assert picks.count('secondary') == 2
+
+    def test_open_provider_is_skipped(self, llm_service):
+        """Test that a provider with an open circuit is not selected"""
+        for _ in range(5):
+            llm_service._breakers['primary'].record_failure()
+
+        picks = {llm_service._next_provider()['name'] for _ in range(4)}
+
+        assert picks == {'secondary'}
+
+    def test_all_providers_open(self, llm_service):
+        """Test that no provider is returned when every circuit is open"""
+        for breaker in llm_service._breakers.values():
+            for _ in range(5):
+                breaker.record_failure()
+
+        assert llm_service._next_provider() is None
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state transitions"""
+
+    def test_opens_after_threshold(self):
+        """Test that the circuit opens once the failure threshold is reached"""
+        breaker = CircuitBreaker(failure_threshold=2, timeout=60)
+        breaker.record_failure()
+        assert breaker.can_execute()
+
+        breaker.record_failure()
+        assert breaker.state is CircuitBreakerState.OPEN
+        assert not breaker.can_execute()
+
+    def test_half_open_after_timeout(self):
+        """Test that the circuit moves to half-open after the timeout"""
+        breaker = CircuitBreaker(failure_threshold=1, timeout=0)
+        breaker.record_failure()
+
+        assert breaker.can_execute()
+        assert breaker.state is CircuitBreakerState.HALF_OPEN
+
+        breaker.record_success()
+        assert breaker.state is CircuitBreakerState.CLOSED
+
+
+class TestRetryBehaviour:
+    """Test status-aware retries in _make_api_call"""
+
+    @patch('llm_service.time.sleep')
+    @patch('llm_service.requests.Session.post')
+    def test_client_error_not_retried(self, mock_post, mock_sleep, llm_service):
+        """Test that a 401 fails without retrying"""
+        mock_post.return_value = Mock(status_code=401, text='unauthorized', headers={})
+
+        with pytest.raises(Exception):
+            llm_service._make_api_call({})
+
+        assert mock_post.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch('llm_service.time.sleep')
+    @patch('llm_service.requests.Session.post')
+    def test_retry_after_is_honored(self, mock_post, mock_sleep, llm_service):
+        """Test that a 429 waits for the Retry-After interval"""
+        throttled = Mock(status_code=429, text='slow down', headers={'Retry-After': '2'})
+        ok = Mock(status_code=200, headers={})
+        ok.content = json.dumps({'choices': []}).encode()
+        mock_post.side_effect = [throttled, ok]
+
+        assert llm_service._make_api_call({}) == {'choices': []}
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch('llm_service.time.sleep')
+    @patch('llm_service.requests.Session.post')
+    def test_all_circuits_open_fails_fast(self, mock_post, mock_sleep, llm_service):
+        """Test that a fully tripped pool raises without sleeping or calling out"""
+        for breaker in llm_service._breakers.values():
+            for _ in range(5):
+                breaker.record_failure()
+
+        with pytest.raises(ProvidersUnavailableError):
+            llm_service._make_api_call({})
+
+        mock_post.assert_not_called()
+        mock_sleep.assert_not_called()
+
+    @patch('llm_service.time.sleep')
+    @patch('llm_service.requests.Session.post')
+    def test_failed_probe_not_retried_without_other_provider(self, mock_post, mock_sleep, llm_service):
+        """Test that a failed half-open probe on the last usable provider is final"""
+        for _ in range(5):
+            llm_service._breakers['secondary'].record_failure()
+        primary = llm_service._breakers['primary']
+        for _ in range(5):
+            primary.record_failure()
+        primary.last_failure_time -= primary.timeout
+        mock_post.return_value = Mock(status_code=503, text='unavailable', headers={})
+
+        with pytest.raises(ProvidersUnavailableError):
+            llm_service._make_api_call({})
+
+        assert mock_post.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch('llm_service.requests.Session.post')
+    def test_payload_sent_as_encoded_json(self, mock_post, llm_service):
+        """Test that the request body is pre-encoded JSON bytes"""
+        mock_post.return_value = Mock(status_code=200, content=b'{"choices": []}', headers={})
+
+        llm_service._make_api_call({'messages': []})
+
+        body = mock_post.call_args.kwargs['data']
+        assert isinstance(body, bytes)
+        assert json.loads(body) == {'messages': [], 'model': 'test-model'}
+
+
+class TestRequestCoalescing:
+    """Test de-duplication of concurrent identical requests"""
+
+    def test_concurrent_callers_share_one_request(self, llm_service):
+        """Test that callers arriving mid-flight reuse the leader's result"""
+        release = threading.Event()
+        calls = []
+
+        def slow_request():
+            calls.append(1)
+            release.wait(timeout=5)
+            return {'summary': 'shared'}
+
+        key = llm_service._prompt_key('same prompt')
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(llm_service._coalesce, key, slow_request) for _ in range(3)]
+            while not llm_service._inflight:
+                time.sleep(0.01)
+            time.sleep(0.05)
+            release.set()
+            results = [future.result(timeout=5) for future in futures]
+
+        assert len(calls) == 1
+        assert all(result == {'summary': 'shared'} for result in results)
+        assert llm_service._inflight == {}
+
+    def test_separate_services_share_one_request(self, llm_service):
+        """Test that services built per render still join each other's requests"""
+        with patch('llm_service.get_llm_config', return_value=llm_service.config):
+            other_service = LLMService()
+        release = threading.Event()
+        calls = []
+
+        def slow_request():
+            calls.append(1)
+            release.wait(timeout=5)
+            return {'summary': 'shared'}
+
+        key = llm_service._prompt_key('same prompt')
+        assert other_service._prompt_key('same prompt') == key
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(llm_service._coalesce, key, slow_request)
+            while not llm_service._inflight:
+                time.sleep(0.01)
+            follower = pool.submit(other_service._coalesce, key, slow_request)
+            time.sleep(0.05)
+            release.set()
+            results = [leader.result(timeout=5), follower.result(timeout=5)]
+
+        assert len(calls) == 1
+        assert results == [{'summary': 'shared'}, {'summary': 'shared'}]
+        assert other_service._inflight == {}
+
+    def test_leader_exception_propagates(self, llm_service):
+        """Test that a failed request raises for the caller and clears its slot"""
+        def failing_request():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            llm_service._coalesce('key', failing_request)
+
+        assert llm_service._inflight == {}
+
+    def test_key_depends_on_model(self, llm_service):
+        """Test that different models never share a request"""
+        with patch('llm_service.get_llm_config', return_value={'api_key': 'key', 'model': 'other-model'}):
+            other_service = LLMService()
+
+        assert other_service._prompt_key('prompt') != llm_service._prompt_key('prompt')
+
+
+class TestResponseCache:
+    """Test caching of parsed insights"""
+
+    INSIGHTS = {'summary': 'ok', 'key_insights': [], 'trends': [], 'recommended_actions': []}
+
+    @patch('llm_service.security_manager.rate_limit_check', return_value=True)
+    def test_repeated_prompt_served_from_cache(self, mock_rate_limit, llm_service):
+        """Test that a repeated prompt does not call the API again"""
+        response = {'choices': [{'message': {'content': json.dumps(self.INSIGHTS)}}]}
+        with patch.object(llm_service, '_make_api_call', return_value=response) as mock_call:
+            first = llm_service.generate_insights('Analyze network KPIs')
+            second = llm_service.generate_insights('Analyze network KPIs')
+
+        assert first == second == self.INSIGHTS
+        assert mock_call.call_count == 1
+
+    @patch('llm_service.security_manager.rate_limit_check', return_value=True)
+    def test_callers_get_independent_copies(self, mock_rate_limit, llm_service):
+        """Test that mutating returned insights does not alter the cached entry"""
+        response = {'choices': [{'message': {'content': json.dumps(self.INSIGHTS)}}]}
+        with patch.object(llm_service, '_make_api_call', return_value=response):
+            first = llm_service.generate_insights('Analyze network KPIs')
+            first['summary'] = 'edited'
+            second = llm_service.generate_insights('Analyze network KPIs')
+            second['error'] = 'edited'
+            third = llm_service.generate_insights('Analyze network KPIs')
+
+        assert third == self.INSIGHTS
+        assert third is not second
+
+    @patch('llm_service.security_manager.rate_limit_check', return_value=True)
+    def test_incomplete_insights_not_cached(self, mock_rate_limit, llm_service):
+        """Test that responses missing required keys are requested again"""
+        response = {'choices': [{'message': {'content': '{"summary": "partial"}'}}]}
+        with patch.object(llm_service, '_make_api_call', return_value=response) as mock_call:
+            llm_service.generate_insights('Analyze network KPIs')
+            llm_service.generate_insights('Analyze network KPIs')
+
+        assert mock_call.call_count == 2
+
+    @patch('llm_service.security_manager.rate_limit_check', return_value=True)
+    def test_mixed_model_pool_bypasses_cache(self, mock_rate_limit, llm_service):
+        """Test that providers with different models never share cached responses"""
+        config = {**llm_service.config, 'providers': [
+            {'name': 'primary'},
+            {'name': 'secondary', 'model': 'other-model'},
+        ]}
+        with patch('llm_service.get_llm_config', return_value=config):
+            service = LLMService()
+        response = {'choices': [{'message': {'content': json.dumps(self.INSIGHTS)}}]}
+        with patch.object(service, '_make_api_call', return_value=response) as mock_call:
+            service.generate_insights('Analyze network KPIs')
+            service.generate_insights('Analyze network KPIs')
+
+        assert mock_call.call_count == 2
+
+    def test_key_uses_provider_model(self, llm_service):
+        """Test that a shared provider model override changes the request key"""
+        config = {**llm_service.config, 'providers': [{'name': 'primary', 'model': 'override-model'}]}
+        with patch('llm_service.get_llm_config', return_value=config):
+            service = LLMService()
+
+        assert service._prompt_key('prompt') != llm_service._prompt_key('prompt')
+
+    def test_entries_expire_and_evict(self):
+        """Test TTL expiry and least-recently-used eviction"""
+        cache = llm_service_module._ResponseCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+
+        with patch('llm_service.time.monotonic', return_value=time.monotonic() + 61):
+            assert cache.get('a') is None
+
+
+class TestPIIScrubber:
+    """Test PII scrubbing paths"""
+
+    SAMPLES = [
+        "Contact john.doe@company.com or 555-123-4567 today",
+        "SSN 123-45-6789, card 4532015112830366, not a card 4532123456789012",
+        "Router 192.168.1.100 with MAC 00:14:22:01:23:45 for John Smith",
+        "Availability 99.5% across 1500 cells",
+        "测试 café +1-555-123-4567",
+    ]
+
+    @pytest.fixture
+    def scrubber(self):
+        """Create PII scrubber with every PII type enabled"""
+        scrubber = PIIScrubber()
+        scrubber.scrub_config = dict(scrubber.scrub_config, ip_addresses=True, mac_addresses=True, names=True)
+        return scrubber
+
+    @pytest.mark.skipif(llm_service_module._HYPERSCAN_DETECTOR is None, reason="hyperscan not installed")
+    def test_hyperscan_matches_re_path(self, scrubber):
+        """Test that the Hyperscan prefilter never changes the scrubbed output"""
+        accelerated = [scrubber.scrub_text(text) for text in self.SAMPLES]
+        with patch.object(llm_service_module, '_HYPERSCAN_DETECTOR', None):
+            plain = [scrubber.scrub_text(text) for text in self.SAMPLES]
+
+        assert accelerated == plain
+
+    def test_single_pass_uses_type_specific_tokens(self, scrubber):
+        """Test that the fused pattern maps each match to its own replacement"""
+        scrubbed = scrubber.scrub_text("Mail john.doe@company.com, MAC 00:14:22:01:23:45, Mary Jones")
+
+        assert scrubbed == "Mail [EMAIL_REDACTED], MAC [MAC_REDACTED], [NAME_REDACTED]"
+
+    def test_clean_text_returned_unchanged(self, scrubber):
+        """Test that text without PII is returned as the same object"""
+        text = "Network availability improved across all regions"
+
+        assert scrubber.scrub_text(text) is text
+
+    def test_luhn_invalid_digit_run_is_not_scrubbed(self, scrubber):
+        """Test that a non-card digit run leaves the text identical and unlogged"""
+        text = "KPI snapshot at 1697040000000 ms"
+
+        with patch.object(llm_service_module.security_logger, 'info') as log_info:
+            assert scrubber.scrub_text(text) is text
+
+        log_info.assert_not_called()
+
+    def test_prefilter_ignores_short_number_clusters(self, scrubber):
+        """Test that dates and percentages do not trigger numeric PII regexes"""
+        text = "Availability 99.95% on 2024-01-15, latency 45ms, churn down 3.2%"
+
+        assert scrubber._prefilter_pii_types(text) & {'phone', 'ssn', 'credit_card'} == set()
+        assert 'phone' in scrubber._prefilter_pii_types("Call +441234567890")
+
+
+class TestFormatInsights:
+    """Test display formatting of insights"""
+
+    def test_prefixes_and_sanitization(self, llm_service):
+        """Test that sections get their prefix, are sanitized and skip non-strings"""
+        formatted = llm_service.format_insights_for_display({
+            'summary': 'Stable <b>network</b>',
+            'key_insights': ['Latency down', 42],
+            'trends': [],
+            'recommended_actions': ['Add capacity'],
+        })
+
+        assert formatted == {
+            'summary': '📊 Stable &lt;b&gt;network&lt;/b&gt;',
+            'key_insights': ['💡 Latency down'],
+            'trends': [],
+            'recommended_actions': ['✅ Add capacity'],
+        }
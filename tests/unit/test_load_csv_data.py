@@ -0,0 +1,144 @@
+"""
+Unit tests for load_csv_data module
+"""
+
+import pytest
+import sqlite3
+import subprocess
+from unittest.mock import patch
+
+import load_csv_data
+from load_csv_data import count_rows, load_csv_files, load_csv_to_sqlite
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    """Write a small CSV with integer, real, text and empty fields"""
+    path = tmp_path / "dim_test.csv"
+    path.write_text(
+        "id,score,label,note\n"
+        "1,99.5,North,\n"
+        "2,98,South,late\n"
+    )
+    return str(path)
+
+
+class TestLoadCsvToSqlite:
+    """Test streaming CSV loader"""
+
+    def test_column_types_and_values(self, csv_file, tmp_path):
+        """Test that column types are inferred and empty fields become NULL"""
+        db_path = str(tmp_path / "test.db")
+
+        assert load_csv_to_sqlite(csv_file, "dim_test", db_path)
+
+        conn = sqlite3.connect(db_path)
+        types = [row[2] for row in conn.execute('PRAGMA table_info("dim_test")')]
+        rows = conn.execute("SELECT * FROM dim_test ORDER BY id").fetchall()
+        conn.close()
+
+        assert types == ["INTEGER", "REAL", "TEXT", "TEXT"]
+        assert rows == [(1, 99.5, "North", None), (2, 98.0, "South", "late")]
+
+    def test_reload_replaces_table(self, csv_file, tmp_path):
+        """Test that loading twice replaces rather than appends"""
+        db_path = str(tmp_path / "test.db")
+
+        load_csv_to_sqlite(csv_file, "dim_test", db_path)
+        load_csv_to_sqlite(csv_file, "dim_test", db_path)
+
+        conn = sqlite3.connect(db_path)
+        count = conn.execute("SELECT COUNT(*) FROM dim_test").fetchone()[0]
+        conn.close()
+
+        assert count == 2
+
+    def test_missing_file_returns_false(self, tmp_path):
+        """Test that a missing CSV is reported as a failed load"""
+        assert not load_csv_to_sqlite(str(tmp_path / "missing.csv"), "dim_test", str(tmp_path / "test.db"))
+
+    @pytest.mark.skipif(load_csv_data.SQLITE3_CLI is None, reason="sqlite3 shell not installed")
+    def test_cli_import_matches_streaming(self, csv_file, tmp_path):
+        """Test that the .import path loads the same rows as executemany"""
+        cli_db = str(tmp_path / "cli.db")
+        stream_db = str(tmp_path / "stream.db")
+
+        load_csv_to_sqlite(csv_file, "dim_test", cli_db)
+        with patch.object(load_csv_data, 'SQLITE3_CLI', None):
+            load_csv_to_sqlite(csv_file, "dim_test", stream_db)
+
+        query = "SELECT * FROM dim_test ORDER BY id"
+        assert sqlite3.connect(cli_db).execute(query).fetchall() == sqlite3.connect(stream_db).execute(query).fetchall()
+
+
+    def test_failed_cli_import_falls_back(self, csv_file, tmp_path):
+        """Test that a failing .import is replaced by the row-by-row load"""
+        db_path = str(tmp_path / "test.db")
+
+        def partial_import(csv_path, table_name, db):
+            conn = sqlite3.connect(db)
+            conn.execute(f'INSERT INTO "{table_name}" VALUES (9, 0, \'partial\', \'\')')
+            conn.commit()
+            conn.close()
+            raise subprocess.CalledProcessError(1, "sqlite3")
+
+        with patch.object(load_csv_data, 'SQLITE3_CLI', 'sqlite3'), \
+                patch.object(load_csv_data, '_import_with_cli', side_effect=partial_import):
+            assert load_csv_to_sqlite(csv_file, "dim_test", db_path)
+
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute("SELECT * FROM dim_test ORDER BY id").fetchall()
+        conn.close()
+
+        assert rows == [(1, 99.5, "North", None), (2, 98.0, "South", "late")]
+
+class TestLoadCsvFiles:
+    """Test parallel CSV loading"""
+
+    def test_loads_all_tables(self, csv_file, tmp_path):
+        """Test that every staged table is copied into the target database"""
+        other_file = tmp_path / "fact_test.csv"
+        other_file.write_text("id,value\n1,2.5\n")
+        db_path = str(tmp_path / "test.db")
+
+        loaded = load_csv_files([(csv_file, "dim_test"), (str(other_file), "fact_test")], db_path, max_workers=2)
+
+        conn = sqlite3.connect(db_path)
+        dim_rows = conn.execute("SELECT * FROM dim_test ORDER BY id").fetchall()
+        fact_types = [row[2] for row in conn.execute('PRAGMA table_info("fact_test")')]
+        conn.close()
+
+        assert loaded == 2
+        assert dim_rows == [(1, 99.5, "North", None), (2, 98.0, "South", "late")]
+        assert fact_types == ["INTEGER", "REAL"]
+
+    def test_failed_file_is_not_counted(self, csv_file, tmp_path):
+        """Test that a file that fails to load is skipped"""
+        db_path = str(tmp_path / "test.db")
+
+        loaded = load_csv_files([(csv_file, "dim_test"), (str(tmp_path / "missing.csv"), "fact_test")], db_path)
+
+        assert loaded == 1
+
+
+class TestCountRows:
+    """Test batched row counts"""
+
+    def test_counts_tables_and_views(self):
+        """Test that one query returns counts for every object"""
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.executemany("INSERT INTO t VALUES (?)", [(1,), (2,)])
+        conn.execute("CREATE VIEW v AS SELECT x FROM t WHERE x > 1")
+
+        assert count_rows(conn, ["t", "v"]) == {"t": 2, "v": 1}
+
+    def test_missing_object_reported_individually(self):
+        """Test that a missing table does not hide the other counts"""
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE t (x INTEGER)")
+
+        counts = count_rows(conn, ["t", "missing"])
+
+        assert counts["t"] == 0
+        assert isinstance(counts["missing"], sqlite3.Error)
@@ -0,0 +1,97 @@
+"""
+Unit tests for logging configuration module
+"""
+
+import json
+import logging
+import threading
+
+import pytest
+
+import logging_config
+
+from logging_config import ContextQueueHandler, LoggingConfig, clear_correlation_id, set_correlation_id
+
+
+@pytest.fixture
+def structured_config(tmp_path):
+    """Structured logging config writing to a temporary directory"""
+    root_logger = logging.getLogger()
+    saved_handlers = root_logger.handlers[:]
+    saved_level = root_logger.level
+
+    config = LoggingConfig(log_dir=str(tmp_path), structured_logging=True)
+    yield config
+
+    config.stop()
+    component_logger = logging.getLogger("unit_component")
+    for logger in (root_logger, component_logger):
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+    component_logger.propagate = True
+    for handler in saved_handlers:
+        root_logger.addHandler(handler)
+    root_logger.setLevel(saved_level)
+    clear_correlation_id()
+
+
+class TestStructuredFileLogging:
+    """Test JSON records written through the queued file handler"""
+
+    def test_file_record_keeps_caller_context(self, structured_config, tmp_path):
+        """Test that the caller's correlation ID and exception survive the queue"""
+        logger = structured_config.get_logger("unit_component", log_file="unit.log")
+        set_correlation_id("REQ-123")
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("lookup %s failed", "kpi")
+        structured_config.stop()
+
+        record = json.loads((tmp_path / "unit.log").read_text().splitlines()[-1])
+
+        assert record["correlation_id"] == "REQ-123"
+        assert record["message"] == "lookup kpi failed"
+        assert record["exception"]["type"] == "ValueError"
+        assert record["exception"]["message"] == "boom"
+
+    def test_reconfiguring_stops_previous_writers(self, structured_config, tmp_path):
+        """Test that a second setup leaves one writer thread and file per log"""
+        structured_config.get_logger("unit_component", log_file="unit.log")
+        old_handlers = [
+            handler for name in ("", "unit_component")
+            for handler in logging.getLogger(name).handlers if isinstance(handler, ContextQueueHandler)
+        ]
+        old_files = [file_handler for handler in old_handlers for file_handler in handler.listener.handlers]
+        threads_before = threading.active_count()
+
+        second = LoggingConfig(log_dir=str(tmp_path), structured_logging=True)
+        second.get_logger("unit_component", log_file="unit.log")
+
+        try:
+            assert threading.active_count() == threads_before
+            assert all(file_handler.stream is None for file_handler in old_files)
+            for name in ("", "unit_component"):
+                queue_handlers = [
+                    handler for handler in logging.getLogger(name).handlers
+                    if isinstance(handler, ContextQueueHandler)
+                ]
+                assert len(queue_handlers) == 1
+                assert queue_handlers[0] not in old_handlers
+        finally:
+            second.stop()
+
+
+class TestHelperLoggers:
+    """Test the loggers behind the convenience functions"""
+
+    def test_reconfiguring_clears_helper_cache(self, structured_config, tmp_path):
+        """Test that helpers resolve their loggers again after a new setup"""
+        logging_config._helper_loggers['performance'] = logging.getLogger('stale')
+
+        second = LoggingConfig(log_dir=str(tmp_path), structured_logging=True)
+        second.stop()
+
+        assert logging_config._helper_loggers == {}
@@ -0,0 +1,221 @@
+"""
+Unit tests for performance utilities module
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import performance_utils
+from performance_utils import ChartDataOptimizer, DataFrameOptimizer, MetricsCalculator, timing_decorator
+
+
+class TestTimingDecorator:
+    """Test operation timing"""
+
+    def test_logs_duration_under_operation_name(self):
+        """Test that each call is logged with the name fixed at decoration"""
+        timed = timing_decorator("unit_op")(lambda x: x * 2)
+
+        with patch.object(performance_utils.logger, 'isEnabledFor', return_value=True), \
+                patch.object(performance_utils, 'log_performance') as log_performance:
+            assert timed(21) == 42
+
+        assert log_performance.call_args.args[0] == "unit_op"
+
+    def test_skips_logging_when_disabled(self):
+        """Test that no performance record is built when INFO is off"""
+        timed = timing_decorator("unit_op")(lambda x: x * 2)
+
+        with patch.object(performance_utils.logger, 'isEnabledFor', return_value=False), \
+                patch.object(performance_utils, 'log_performance') as log_performance:
+            assert timed(21) == 42
+
+        log_performance.assert_not_called()
+
+    def test_failure_is_logged_and_reraised(self):
+        """Test that exceptions propagate after being logged"""
+        def fail():
+            raise ValueError("boom")
+
+        with patch.object(performance_utils.logger, 'error') as log_error:
+            with pytest.raises(ValueError):
+                timing_decorator()(fail)()
+
+        assert log_error.call_args.args[1].endswith("fail")
+
+
+class TestOptimizeMemoryUsage:
+    """Test DataFrame dtype downcasting"""
+
+    def test_downcasts_like_to_numeric(self):
+        """Test that each column gets the type pd.to_numeric would choose"""
+        df = pd.DataFrame({
+            'small_int': np.array([1, -5, 100], dtype='int64'),
+            'wide_int': np.array([0, 70000, -1], dtype='int64'),
+            'rounded': [1.5, 2.25, np.nan],
+            'precise': [123456789.123, 1.0, 2.0],
+            'region': np.array(['North', 'North', 'North'], dtype=object),
+        })
+
+        optimized = DataFrameOptimizer.optimize_memory_usage(df)
+
+        assert optimized.dtypes.astype(str).to_dict() == {
+            'small_int': 'int8',
+            'wide_int': 'int32',
+            'rounded': 'float32',
+            'precise': 'float64',
+            'region': 'category',
+        }
+        assert optimized['precise'].tolist() == df['precise'].tolist()
+
+    def test_memory_not_measured_when_logging_disabled(self):
+        """Test that deep memory usage is skipped when INFO is off"""
+        df = pd.DataFrame({'value': np.arange(10, dtype='int64')})
+
+        with patch.object(performance_utils.logger, 'isEnabledFor', return_value=False), \
+                patch.object(pd.DataFrame, 'memory_usage') as memory_usage:
+            DataFrameOptimizer.optimize_memory_usage(df)
+
+        memory_usage.assert_not_called()
+
+
+class TestEfficientJoins:
+    """Test grouping and merging without copying inputs"""
+
+    def test_groupby_and_merge_leave_input_unchanged(self):
+        """Test that categorical keys are used without converting the caller's frame"""
+        df = pd.DataFrame({
+            'region': pd.Series(['North', 'South'] * 20, dtype=object),
+            'value': np.arange(40.0),
+        })
+        regions = pd.DataFrame({'region': pd.Series(['North', 'South'], dtype=object), 'code': ['N', 'S']})
+
+        grouped = DataFrameOptimizer.efficient_groupby_agg(df, ['region'], {'value': 'sum'})
+        merged = DataFrameOptimizer.efficient_merge(df, regions, 'region')
+
+        assert grouped.index.name == 'region'
+        assert grouped['value'].to_dict() == {'North': 380.0, 'South': 400.0}
+        assert len(merged) == 40
+        assert df['region'].dtype == object
+        assert regions['region'].dtype == object
+
+
+class TestStatisticalSummary:
+    """Test statistical summary calculation"""
+
+    def test_summary_counts_nulls_separately(self):
+        """Test that quartiles skip nulls while count includes them"""
+        summary = MetricsCalculator.calculate_statistical_summary([1.0, 2.0, 3.0, 4.0, None])
+
+        assert summary.mean == 2.5
+        assert summary.median == 2.5
+        assert summary.q25 == 1.75
+        assert summary.q75 == 3.25
+        assert (summary.min, summary.max) == (1.0, 4.0)
+        assert summary.count == 5
+        assert summary.null_count == 1
+
+
+class TestAnalyzeTrend:
+    """Test linear trend analysis"""
+
+    def test_slope_of_recent_periods(self):
+        """Test that only the last periods values set the slope"""
+        trend = MetricsCalculator.analyze_trend([50.0, 10.0, 20.0, 30.0], periods=3)
+
+        assert trend.slope == 10.0
+        assert trend.trend == "increasing"
+        assert trend.direction == "up"
+
+    def test_flat_series_is_stable(self):
+        """Test that constant values have exactly zero slope"""
+        trend = MetricsCalculator.analyze_trend([5.0, 5.0, 5.0])
+
+        assert trend.slope == 0.0
+        assert trend.direction == "stable"
+
+    def test_result_serializes_as_dict(self):
+        """Test that the result converts to the dictionary form for JSON"""
+        trend = MetricsCalculator.analyze_trend([1.0])
+
+        assert trend._asdict() == {"trend": "insufficient_data", "direction": "unknown", "strength": 0, "slope": 0.0}
+
+
+class TestEfficientFilter:
+    """Test multi-condition filtering"""
+
+    def test_conditions_are_combined(self):
+        """Test scalar, list and callable conditions together"""
+        df = pd.DataFrame({
+            'region': ['North', 'South', 'North', 'East'],
+            'tier': [1, 2, 2, 1],
+            'value': [5.0, 7.0, 9.0, 1.0],
+        })
+
+        result = DataFrameOptimizer.efficient_filter(
+            df, {'region': ['North', 'South'], 'tier': 2, 'value': lambda v: v > 8}
+        )
+
+        assert result.index.tolist() == [2]
+
+    def test_string_values_are_not_parsed(self):
+        """Test that quotes in a value are compared literally"""
+        df = pd.DataFrame({'site name': ["O'Hare", 'Midway']})
+
+        result = DataFrameOptimizer.efficient_filter(df, {'site name': "O'Hare"})
+
+        assert result['site name'].tolist() == ["O'Hare"]
+
+
+class TestSampleForVisualization:
+    """Test chart downsampling"""
+
+    def test_time_series_keeps_endpoints_in_order(self):
+        """Test that unsorted time series are sorted and sampled end to end"""
+        df = pd.DataFrame({'ts': pd.date_range('2023-08-01', periods=500, freq='h'), 'value': np.arange(500)})
+
+        sampled = ChartDataOptimizer.sample_for_visualization(df.iloc[::-1], max_points=50, time_col='ts')
+
+        assert len(sampled) == 50
+        assert sampled['ts'].is_monotonic_increasing
+        assert sampled['value'].iloc[[0, -1]].tolist() == [0, 499]
+
+    def test_lttb_keeps_spikes(self):
+        """Test that an isolated peak survives value-aware downsampling"""
+        values = np.zeros(5000)
+        values[1234] = 100.0
+        df = pd.DataFrame({'ts': np.arange(5000), 'value': values})
+
+        sampled = ChartDataOptimizer.sample_for_visualization(df, max_points=100, time_col='ts', value_col='value')
+
+        assert len(sampled) == 100
+        assert sampled['value'].max() == 100.0
+
+
+class TestAggregateForChart:
+    """Test chart aggregation"""
+
+    def test_binned_mean_includes_empty_bins(self):
+        """Test per-bin means, NaN for empty bins, without touching the input"""
+        df = pd.DataFrame({'x': [0.0, 1.0, 9.0, 10.0], 'y': [1.0, 3.0, 5.0, np.nan]})
+
+        result = ChartDataOptimizer.aggregate_for_chart(df, 'x', 'y', 'mean', bins=3)
+
+        assert list(result.columns) == ['x_binned', 'y']
+        assert result['y'].tolist()[0] == 2.0
+        assert np.isnan(result['y'].tolist()[1])
+        assert result['y'].tolist()[2] == 5.0
+        assert list(df.columns) == ['x', 'y']
+
+    def test_binned_sum_matches_groupby(self):
+        """Test that bincount sums equal a categorical groupby"""
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({'x': rng.normal(size=200), 'y': rng.normal(size=200)})
+
+        result = ChartDataOptimizer.aggregate_for_chart(df, 'x', 'y', 'sum', bins=7)
+        expected = df['y'].groupby(pd.cut(df['x'], bins=7), observed=False).sum()
+
+        assert np.allclose(result['y'], expected.to_numpy())
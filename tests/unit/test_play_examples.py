@@ -0,0 +1,30 @@
+"""
+Unit tests for mock play examples module
+"""
+
+from mock_data import generate_network_plays, get_all_plays_by_area, get_random_plays_by_area
+from mock_data.play_examples import get_plays_for_area
+from models.play_models import SubjectArea
+
+
+class TestPlayCatalogue:
+    """Test that catalogue lookups hand out independent plays"""
+
+    def test_mutating_a_play_does_not_leak(self):
+        """Test that re-scoring one caller's play leaves later callers untouched"""
+        first = generate_network_plays()
+        first[0].score = 9.9
+        first[0].rank = 1
+
+        for plays in (generate_network_plays(), get_plays_for_area(SubjectArea.NETWORK),
+                      get_all_plays_by_area()["network"]):
+            assert plays[0].title == first[0].title
+            assert (plays[0].score, plays[0].rank) == (0.0, 0)
+            assert plays[0] is not first[0]
+
+    def test_random_plays_come_from_area(self):
+        """Test that sampled plays belong to the requested area"""
+        plays = get_random_plays_by_area("customer", count=2)
+
+        assert len(plays) == 2
+        assert all(play.subject_area is SubjectArea.CUSTOMER for play in plays)
@@ -0,0 +1,308 @@
+"""
+Unit tests for play models module
+"""
+
+import json
+import sys
+import uuid
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from models import play_models
+from models.play_models import AgentState, Play, PlayCategory, Portfolio, SubjectArea, WorkflowStatus
+
+
+def make_play(cost, roi, risk, impact=5.0, effort=5.0):
+    """Create a play with the scores that drive portfolio metrics"""
+    return Play(
+        title=f"Play {cost}",
+        impact_score=impact,
+        effort_score=effort,
+        roi_score=roi,
+        risk_score=risk,
+        estimated_cost=cost
+    )
+
+
+class TestPlayPriority:
+    """Test priority level calculation"""
+
+    @pytest.mark.parametrize("score,expected", [(10.0, 1), (7.0, 2), (5.5, 3), (4.0, 4), (0.0, 5)])
+    def test_priority_levels(self, score, expected):
+        """Test that each priority threshold maps to its level"""
+        play = Play(impact_score=score, effort_score=10 - score, roi_score=score, risk_score=10 - score)
+
+        assert play.priority_level == expected
+
+    def test_given_level_is_rederived(self):
+        """Test that the constructor derives the level even when one is passed"""
+        play = Play(impact_score=10.0, effort_score=0.0, roi_score=10.0, risk_score=0.0, priority_level=5)
+
+        assert play.priority_level == 1
+
+    def test_batch_matches_per_play(self):
+        """Test that the vectorized calculation agrees with Play construction"""
+        scores = [(9.0, 2.0, 8.5, 1.0), (6.5, 5.0, 7.0, 4.0), (3.0, 8.0, 2.0, 9.0), (12.0, -1.0, 5.0, 5.0)]
+        plays = [Play(impact_score=i, effort_score=e, roi_score=r, risk_score=k) for i, e, r, k in scores]
+
+        levels = Play.priority_levels_for_scores(*zip(*scores))
+
+        assert levels.tolist() == [play.priority_level for play in plays]
+
+    def test_threaded_batch_matches_serial(self):
+        """Test that scoring in chunks across threads gives the serial result"""
+        rng = np.random.default_rng(0)
+        scores = [rng.uniform(-1.0, 11.0, 1001) for _ in range(4)]
+        serial = Play.priority_levels_for_scores(*scores)
+
+        with patch.object(play_models, "_PARALLEL_SCORING_MIN_PLAYS", 100), \
+                patch.object(play_models.os, "cpu_count", return_value=4):
+            threaded = Play.priority_levels_for_scores(*scores)
+
+        assert np.array_equal(threaded, serial)
+
+
+class TestPlayStrings:
+    """Test string interning on construction"""
+
+    def test_equal_titles_and_tags_share_objects(self):
+        """Test that separately built equal strings end up as one object"""
+        first = Play(title="".join(["Reduce ", "Churn"]), tags=["".join(["customer-", "retention"])])
+        second = Play(title="".join(["Reduce ", "Ch", "urn"]), tags=("".join(["customer", "-retention"]),))
+
+        assert first.title is second.title
+        assert first.tags[0] is second.tags[0]
+        assert isinstance(first.tags, list) and isinstance(second.tags, tuple)
+
+
+    def test_non_str_values_pass_through(self):
+        """Test that None, enums and str subclasses are kept rather than interned"""
+        class Label(str):
+            pass
+
+        label = Label("custom")
+        play = Play(title=None, tags=[SubjectArea.NETWORK, label])
+
+        assert play.title is None
+        assert play.tags[0] is SubjectArea.NETWORK
+        assert play.tags[1] is label
+
+
+class TestBulkCreate:
+    """Test batched play construction"""
+
+    def test_unique_ids_and_shared_timestamp(self):
+        """Test that each play gets its own UUID4 and the batch one timestamp"""
+        plays = Play.bulk_create([{"title": "A", "roi_score": 7.0}, {"title": "B", "roi_score": 3.0}])
+
+        assert [play.title for play in plays] == ["A", "B"]
+        assert len({play.id for play in plays}) == 2
+        assert all(uuid.UUID(play.id).version == 4 for play in plays)
+        assert plays[0].created_at is plays[1].created_at
+
+    def test_priorities_match_single_construction(self):
+        """Test that vectorized priorities equal those computed per play"""
+        records = [
+            {"impact_score": 9.0, "effort_score": 2.0, "roi_score": 8.5, "risk_score": 1.0},
+            {"impact_score": 3.0, "effort_score": 8.0, "roi_score": 2.0, "risk_score": 9.0},
+            {"roi_score": 12.0},
+        ]
+
+        plays = Play.bulk_create(records)
+
+        assert [play.priority_level for play in plays] == [Play(**record).priority_level for record in records]
+        assert all(type(play.priority_level) is int for play in plays)
+
+    def test_record_priority_level_is_rederived(self):
+        """Test that bulk creation, like the constructor, ignores a stale level"""
+        plays = Play.bulk_create([{"impact_score": 10.0, "roi_score": 10.0, "priority_level": 5}])
+
+        assert plays[0].priority_level == Play(impact_score=10.0, roi_score=10.0).priority_level
+
+    def test_explicit_id_is_kept(self):
+        """Test that a record's own id overrides the generated one"""
+        plays = Play.bulk_create([{"id": "fixed-id", "title": "A"}])
+
+        assert plays[0].id == "fixed-id"
+
+
+class TestPlaySerialization:
+    """Test play dictionary conversion"""
+
+    def test_to_dict_reflects_optimization_scores(self):
+        """Test that score and rank set after a first to_dict are serialized"""
+        play = Play(title="A", roi_score=7.0, tags=["network"])
+        play.to_dict()
+        play.score = 8.5
+        play.rank = 2
+
+        data = play.to_dict()
+
+        assert (data["score"], data["rank"]) == (8.5, 2)
+        assert list(data)[9:11] == ["score", "rank"]
+
+    def test_to_dict_reflects_field_changes(self):
+        """Test that any field set after a first to_dict is serialized"""
+        play = Play(title="a", estimated_cost=10.0)
+        play.to_dict()
+        play.title = "b"
+        play.estimated_cost = 99.0
+
+        data = play.to_dict()
+
+        assert (data["title"], data["estimated_cost"]) == ("b", 99.0)
+        assert json.loads(Portfolio(selected_plays=[play]).to_json())["selected_plays"][0]["title"] == "b"
+
+    def test_score_changes_reuse_cached_dict(self):
+        """Test that re-scoring patches the cached dict instead of rebuilding it"""
+        play = Play(title="a", tags=["network"])
+        cached = play._cached_dict()
+        play.score = 4.0
+        play.rank = 3
+        play.tags = ["core"]
+
+        assert play._cached_dict() is cached
+        assert (cached["score"], cached["rank"], cached["tags"]) == (4.0, 3, ["core"])
+
+    def test_no_per_assignment_hook(self):
+        """Test that field writes, including during construction, stay plain slot stores"""
+        assert Play.__setattr__ is object.__setattr__
+
+    def test_portfolio_to_json_round_trips(self):
+        """Test that JSON output decodes to the portfolio dictionary"""
+        portfolio = Portfolio(selected_plays=[Play(title="A", tags=["network"])])
+
+        assert json.loads(portfolio.to_json()) == portfolio.to_dict()
+
+    def test_indented_json_round_trips(self):
+        """Test that indented output is multi-line and decodes the same"""
+        portfolio = Portfolio(selected_plays=[Play(title="A")])
+
+        data = portfolio.to_json(indent=True)
+
+        assert b"\n  " in data
+        assert json.loads(data) == portfolio.to_dict()
+
+    def test_to_json_reflects_later_scores(self):
+        """Test that JSON output picks up score and rank set after a first encode"""
+        play = Play(title="A")
+        portfolio = Portfolio(selected_plays=[play])
+        portfolio.to_json()
+        play.score = 8.5
+        play.rank = 1
+
+        data = json.loads(portfolio.to_json())
+
+        assert (data["selected_plays"][0]["score"], data["selected_plays"][0]["rank"]) == (8.5, 1)
+
+    def test_to_dict_returns_independent_copies(self):
+        """Test that mutating a returned dict does not leak into later calls"""
+        play = Play(title="A", tags=["network"])
+
+        first = play.to_dict()
+        first["title"] = "changed"
+        first["tags"].append("extra")
+
+        assert play.to_dict()["title"] == "A"
+        assert play.to_dict()["tags"] == ["network"]
+
+
+class TestPortfolioMetrics:
+    """Test portfolio-level metric calculation"""
+
+    def test_metrics_from_selected_plays(self):
+        """Test cost-weighted ROI, average priority and risk bins"""
+        plays = [
+            make_play(100.0, 8.0, 3.0),
+            make_play(300.0, 4.0, 6.0),
+            make_play(600.0, 6.0, 6.5),
+        ]
+        portfolio = Portfolio(selected_plays=plays)
+
+        assert portfolio.total_investment == 1000.0
+        assert portfolio.total_roi == pytest.approx((800.0 + 1200.0 + 3600.0) / 1000.0)
+        assert portfolio.average_priority == pytest.approx(sum(p.priority_level for p in plays) / 3)
+        assert portfolio.risk_distribution == {"Low": 1, "Medium": 1, "High": 1}
+
+    def test_zero_cost_portfolio_has_zero_roi(self):
+        """Test that ROI falls back to zero when nothing costs anything"""
+        portfolio = Portfolio(selected_plays=[make_play(0.0, 9.0, 1.0)])
+
+        assert portfolio.total_roi == 0.0
+        assert portfolio.risk_distribution == {"Low": 1}
+
+    def test_add_play_matches_full_recalculation(self):
+        """Test that incremental updates agree with recomputing from scratch"""
+        plays = [make_play(100.0 * i, i % 10, i % 9) for i in range(1, 20)]
+        incremental = Portfolio()
+        for play in plays:
+            incremental.add_play(play)
+        rebuilt = Portfolio(selected_plays=list(plays))
+
+        assert incremental.total_investment == pytest.approx(rebuilt.total_investment)
+        assert incremental.total_roi == pytest.approx(rebuilt.total_roi)
+        assert incremental.average_priority == pytest.approx(rebuilt.average_priority)
+        assert incremental.risk_distribution == rebuilt.risk_distribution
+
+    def test_rejected_play_does_not_change_metrics(self):
+        """Test that rejected plays are kept out of the metrics"""
+        portfolio = Portfolio(selected_plays=[make_play(100.0, 8.0, 2.0)])
+        portfolio.add_play(make_play(900.0, 1.0, 9.0), selected=False)
+
+        assert portfolio.total_investment == 100.0
+        assert portfolio.risk_distribution == {"Low": 1}
+
+    def test_removing_last_play_resets_metrics(self):
+        """Test that an emptied portfolio reports zero metrics"""
+        play = make_play(100.0, 8.0, 7.0)
+        portfolio = Portfolio()
+        portfolio.add_play(play)
+        portfolio.remove_play(play.id)
+
+        assert portfolio.total_investment == 0.0
+        assert portfolio.total_roi == 0.0
+        assert portfolio.average_priority == 0.0
+        assert portfolio.risk_distribution == {}
+
+
+class TestPortfolioLookups:
+    """Test priority and category lookups"""
+
+    def test_lookups_follow_add_and_remove(self):
+        """Test that lookups reflect plays added and removed after construction"""
+        first = make_play(100.0, 9.0, 1.0, impact=9.0, effort=1.0)
+        second = make_play(200.0, 9.0, 1.0, impact=9.0, effort=1.0)
+        other = Play(title="Other", category=PlayCategory.REVENUE_GROWTH)
+        portfolio = Portfolio(selected_plays=[first])
+        portfolio.add_play(second)
+        portfolio.add_play(other)
+
+        assert portfolio.get_plays_by_priority(first.priority_level) == [first, second]
+        assert portfolio.get_plays_by_category(PlayCategory.REVENUE_GROWTH) == [other]
+
+        portfolio.remove_play(first.id)
+
+        assert portfolio.get_plays_by_priority(first.priority_level) == [second]
+        assert portfolio.get_plays_by_priority(0) == []
+
+    def test_lookup_returns_copy(self):
+        """Test that changing a returned list leaves the portfolio untouched"""
+        play = make_play(100.0, 5.0, 5.0)
+        portfolio = Portfolio(selected_plays=[play])
+
+        portfolio.get_plays_by_category(play.category).clear()
+
+        assert portfolio.get_plays_by_category(play.category) == [play]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10")
+@pytest.mark.parametrize("model", [Play, Portfolio, AgentState, WorkflowStatus])
+def test_models_use_slots(model):
+    """Test that model instances carry no per-instance __dict__"""
+    instance = model()
+
+    assert not hasattr(instance, "__dict__")
+    with pytest.raises(AttributeError):
+        instance.undeclared = True